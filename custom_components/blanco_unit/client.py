@@ -120,7 +120,7 @@ class _RequestEnvelope:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class _SetTemperaturePars:
     """Internal: Parameters for setting cooling temperature."""
 
@@ -133,7 +133,7 @@ class _SetTemperaturePars:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class _SetHeatingTemperaturePars:
     """Internal: Parameters for setting heating temperature (CHOICE.All only)."""
 
@@ -146,7 +146,7 @@ class _SetHeatingTemperaturePars:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class _SetWaterHardnessPars:
     """Internal: Parameters for setting water hardness."""
 
@@ -159,7 +159,7 @@ class _SetWaterHardnessPars:
         return {"wtr_hardness": {"val": self.level}}
 
 
-@dataclass
+@dataclass(slots=True)
 class _ChangePinPars:
     """Internal: Parameters for changing PIN."""
 
@@ -172,7 +172,7 @@ class _ChangePinPars:
         return {"new_pass": self.new_pin}
 
 
-@dataclass
+@dataclass(slots=True)
 class _DispensePars:
     """Internal: Parameters for dispensing water."""
 
@@ -184,7 +184,7 @@ class _DispensePars:
         return {"disp_amt": self.amount_ml, "co2_int": self.co2_intensity}
 
 
-@dataclass
+@dataclass(slots=True)
 class _SetCalibrationPars:
     """Internal: Parameters for setting calibration."""
 
@@ -196,7 +196,7 @@ class _SetCalibrationPars:
         return {self.calib_type: {"val": self.amount}}
 
 
-@dataclass
+@dataclass(slots=True)
 class _ConnectWifiPars:
     """Internal: Parameters for connecting to a WiFi network."""
 
@@ -208,7 +208,7 @@ class _ConnectWifiPars:
         return {"ssid": {"val": self.ssid}, "password": {"val": self.password}}
 
 
-@dataclass
+@dataclass(slots=True)
 class _AllowCloudServicesPars:
     """Internal: Parameters for allowing cloud services."""
 
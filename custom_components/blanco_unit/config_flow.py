@@ -33,6 +33,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}([-:])){5}([0-9A-Fa-f]{2})$")
+
 
 @dataclass
 class ValidationResult:
@@ -111,11 +113,7 @@ class BlancoUnitConfigFlow(ConfigFlow, domain=DOMAIN):
         _LOGGER.debug("validate_input %s", user_input)
 
         # Validate MAC address format
-        if not bool(
-            re.match(
-                r"^([0-9A-Fa-f]{2}([-:])){5}([0-9A-Fa-f]{2})$", user_input[CONF_MAC]
-            )
-        ):
+        if not _MAC_RE.match(user_input[CONF_MAC]):
             _LOGGER.error("Invalid MAC code: %s", user_input[CONF_MAC])
             return ValidationResult({CONF_ERROR: "invalid_mac_code"})
 
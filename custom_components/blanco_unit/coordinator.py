@@ -19,6 +19,7 @@ from homeassistant.components.bluetooth import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .client import BlancoUnitAuthenticationError, BlancoUnitBluetoothClient
@@ -35,6 +36,9 @@ _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 1
 
+# Adverts keep arriving while the device is in range, refresh at most once per poll
+AVAILABLE_REFRESH_COOLDOWN = timedelta(minutes=1)
+
 
 class BlancoUnitCoordinator(DataUpdateCoordinator[BlancoUnitData]):
     """Blanco Unit BLE coordinator."""
@@ -57,6 +61,7 @@ class BlancoUnitCoordinator(DataUpdateCoordinator[BlancoUnitData]):
         self.address = device.address
         self.mac_address = config_entry.data[CONF_MAC]
         self._random_mac = self.mac_address == RANDOM_MAC_PLACEHOLDER
+        self._update_inflight: asyncio.Future[BlancoUnitData] | None = None
 
         # Create client
         self._client = BlancoUnitBluetoothClient(
@@ -77,6 +82,13 @@ class BlancoUnitCoordinator(DataUpdateCoordinator[BlancoUnitData]):
 
         # Setup listeners
         self._unsub_options_update_listener = unsub_options_update_listener
+        self._available_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=AVAILABLE_REFRESH_COOLDOWN.total_seconds(),
+            immediate=True,
+            function=self.async_request_refresh,
+        )
         self._unsub_unavailable_update_listener = bluetooth.async_track_unavailable(
             hass, self._unavailable_callback, self.address, connectable=True
         )
@@ -102,7 +114,7 @@ class BlancoUnitCoordinator(DataUpdateCoordinator[BlancoUnitData]):
         self, info: BluetoothServiceInfoBleak, change: BluetoothChange
     ) -> None:
         _LOGGER.debug("%s is discovered again", info.address)
-        self.hass.async_create_task(self.async_request_refresh())  # load the data
+        self._available_debouncer.async_schedule_call()  # load the data
 
     def _unavailable_callback(self, info: BluetoothServiceInfoBleak) -> None:
         _LOGGER.debug("%s is no longer seen", info.address)
@@ -113,6 +125,7 @@ class BlancoUnitCoordinator(DataUpdateCoordinator[BlancoUnitData]):
         _LOGGER.debug("unload coordinator")
         self._unsub_unavailable_update_listener()
         self._unsub_available_update_listener()
+        self._available_debouncer.async_shutdown()
         await self._client.disconnect()
 
     async def refresh_data(self) -> None:
@@ -268,7 +281,34 @@ class BlancoUnitCoordinator(DataUpdateCoordinator[BlancoUnitData]):
     # -------------------------------
 
     async def _async_update_data(self) -> BlancoUnitData:
-        """Fetch data from device."""
+        """Fetch data from device, joining a fetch that is already running."""
+        if (inflight := self._update_inflight) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only give up if this caller was cancelled, not the one we joined
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task and task.cancelling()):
+                    raise
+            return await self._async_update_data()
+
+        future = self._update_inflight = self.hass.loop.create_future()
+        try:
+            data = await self._async_fetch_data()
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()  # raised to this caller, don't log it as unretrieved
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            if not future.done():
+                future.cancel()
+            self._update_inflight = None
+
+    async def _async_fetch_data(self) -> BlancoUnitData:
+        """Read all data from device."""
         try:
             return BlancoUnitData(
                 system_info=await self._client.get_system_info(),
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitSystemInfo:
     """System information from Blanco Unit."""
 
@@ -16,7 +16,7 @@ class BlancoUnitSystemInfo:
     reset_cnt: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitSettings:
     """Configuration settings from Blanco Unit."""
 
@@ -33,7 +33,7 @@ class BlancoUnitSettings:
     gbl_classic_wtr_ratio: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitStatus:
     """Real-time status from Blanco Unit."""
 
@@ -53,7 +53,7 @@ class BlancoUnitStatus:
     conn_controller_status: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitIdentity:
     """Device identity information."""
 
@@ -61,7 +61,7 @@ class BlancoUnitIdentity:
     service_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitWifiInfo:
     """WiFi and network information."""
 
@@ -76,7 +76,7 @@ class BlancoUnitWifiInfo:
     subnet: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitWifiNetwork:
     """A discovered WiFi access point."""
 
@@ -85,7 +85,7 @@ class BlancoUnitWifiNetwork:
     auth_mode: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BlancoUnitData:
     """Holds the data of the device."""
 
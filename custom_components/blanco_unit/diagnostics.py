@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -11,7 +12,7 @@ from . import BlancoUnitConfigEntry
 from .const import CONF_MAC, CONF_PIN
 from .coordinator import BlancoUnitCoordinator
 
-TO_REDACT = {CONF_PIN, CONF_MAC}
+TO_REDACT = frozenset({CONF_PIN, CONF_MAC})
 
 
 async def async_get_config_entry_diagnostics(
@@ -19,8 +20,10 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: BlancoUnitCoordinator = config_entry.runtime_data
+    # plain dicts, so the JSON encoder does not have to walk the dataclasses
+    unit_data = asdict(coordinator.data) if coordinator.data is not None else None
 
     return {
-        "config_entry_data": async_redact_data(dict(config_entry.data), TO_REDACT),
-        "blanco:unit_data": coordinator.data,
+        "config_entry_data": async_redact_data(config_entry.data, TO_REDACT),
+        "blanco:unit_data": unit_data,
     }
@@ -132,6 +132,25 @@ def mock_bleak_client_fixture():
     return client
 
 
+@pytest.fixture(name="callback_mock")
+def callback_mock_fixture():
+    """Return a mock connection callback for the Bluetooth client."""
+    return MagicMock()
+
+
+@pytest.fixture(name="bt_client")
+def bt_client_fixture(callback_mock):
+    """Return a Blanco Unit Bluetooth client for a test device."""
+    from bleak.backends.device import BLEDevice
+
+    from custom_components.blanco_unit.client import BlancoUnitBluetoothClient
+
+    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
+    return BlancoUnitBluetoothClient(
+        pin="12345", device=device, connection_callback=callback_mock
+    )
+
+
 @pytest.fixture(autouse=True)
 def mock_coord_for_snapshots(mock_blanco_unit_data):
     """Mock the coordinator for snapshot tests."""
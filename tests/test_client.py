@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Awaitable, Callable
+import re
+from typing import Any, Final
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from bleak.backends.device import BLEDevice
+import orjson
 import pytest
 
 from custom_components.blanco_unit.client import (
@@ -30,6 +33,61 @@ from custom_components.blanco_unit.client import (
     validate_pin,
 )
 
+_PAIRING_ID = 10
+_TXN_ID = 11
+
+_RE_TEMP = re.compile("Temperature must be between 4 and 10")
+_RE_AMOUNT = re.compile("Amount must be at least 50ml")
+_RE_CO2 = re.compile("CO2 intensity must be")
+
+
+def _frame(msg_id: int, obj: dict[str, Any]) -> bytes:
+    """Build a single-packet BLE response for a message ID and a JSON payload."""
+    body = orjson.dumps(obj)
+    buf = bytearray(len(body) + 7)
+    buf[:5] = (0xFF, 0x00, 1, msg_id, 0x00)
+    buf[5:-2] = body
+    buf[-2:] = b"\x00\xff"
+    return bytes(buf)
+
+
+_PAIRING_PACKET: Final[bytes] = _frame(
+    _PAIRING_ID, {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
+)
+
+
+def _make_read_stub(*packets: bytes) -> Callable[..., Awaitable[bytes]]:
+    """Return a read_gatt_char stub that yields the given packets in order."""
+    it = iter(packets)
+
+    async def _read(*args: Any, **kwargs: Any) -> bytes:
+        return next(it)
+
+    return _read
+
+
+async def _noop_write(*args: Any, **kwargs: Any) -> None:
+    """Stand in for write_gatt_char when the written data is not inspected."""
+
+
+@pytest.fixture(name="mock_establish", autouse=True)
+def mock_establish_fixture(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Patch establish_connection to return a connected mock BLE client."""
+    mock_ble_client = AsyncMock()
+    mock_ble_client.is_connected = True
+    mock_establish = AsyncMock(return_value=mock_ble_client)
+    monkeypatch.setattr(
+        "custom_components.blanco_unit.client.establish_connection", mock_establish
+    )
+    return mock_establish
+
+
+@pytest.fixture(name="mock_ble_client")
+def mock_ble_client_fixture(mock_establish: AsyncMock) -> AsyncMock:
+    """Return the BLE client handed out by the patched establish_connection."""
+    return mock_establish.return_value
+
+
 # -------------------------------
 # Exception Tests
 # -------------------------------
@@ -270,8 +328,7 @@ def test_protocol_parse_response_single_packet():
     """Test parsing response from single packet."""
     protocol = _BlancoUnitProtocol()
     response_data = {"status": "ok"}
-    json_str = json.dumps(response_data)
-    packet = bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
+    packet = _frame(_PAIRING_ID, response_data)
 
     result = protocol.parse_response([packet])
     assert result["status"] == "ok"
@@ -281,8 +338,7 @@ def test_protocol_parse_response_multiple_packets():
     """Test parsing response from multiple packets."""
     protocol = _BlancoUnitProtocol()
     response_data = {"status": "ok", "data": "test"}
-    json_str = json.dumps(response_data)
-    payload = json_str.encode("utf-8") + b"\x00\xff"
+    payload = orjson.dumps(response_data) + b"\x00\xff"
 
     # Split into two packets
     packet1 = bytes([0xFF, 0x00, 2, 10, 0x00]) + payload[:20]
@@ -377,7 +433,6 @@ def test_protocol_extract_pars_with_empty_results():
     assert result == {}
 
 
-@pytest.mark.asyncio
 async def test_protocol_read_response_chunks_success():
     """Test reading response chunks successfully."""
     protocol = _BlancoUnitProtocol()
@@ -393,7 +448,6 @@ async def test_protocol_read_response_chunks_success():
     assert chunks[0] == packet
 
 
-@pytest.mark.asyncio
 async def test_protocol_read_response_chunks_multiple():
     """Test reading multiple response chunks."""
     protocol = _BlancoUnitProtocol()
@@ -403,17 +457,7 @@ async def test_protocol_read_response_chunks_multiple():
     packet1 = bytes([0xFF, 0x00, 2, 10, 0x00]) + b'{"status":'
     packet2 = bytes([10, 1]) + b'"ok"}\x00\xff'
 
-    # Simulate reading chunks
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return packet1
-        return packet2
-
-    mock_client.read_gatt_char = mock_read
+    mock_client.read_gatt_char = _make_read_stub(packet1, packet2)
 
     chunks = await protocol.read_response_chunks(mock_client)
 
@@ -422,7 +466,6 @@ async def test_protocol_read_response_chunks_multiple():
     assert chunks[1] == packet2
 
 
-@pytest.mark.asyncio
 async def test_protocol_read_response_chunks_timeout():
     """Test reading response chunks with timeout."""
     protocol = _BlancoUnitProtocol()
@@ -436,7 +479,6 @@ async def test_protocol_read_response_chunks_timeout():
         await protocol.read_response_chunks(mock_client)
 
 
-@pytest.mark.asyncio
 async def test_protocol_read_response_chunks_error():
     """Test reading response chunks with read error."""
     protocol = _BlancoUnitProtocol()
@@ -449,7 +491,6 @@ async def test_protocol_read_response_chunks_error():
         await protocol.read_response_chunks(mock_client)
 
 
-@pytest.mark.asyncio
 async def test_protocol_send_pairing_request():
     """Test sending pairing request."""
     protocol = _BlancoUnitProtocol()
@@ -459,10 +500,7 @@ async def test_protocol_send_pairing_request():
     response_data = {
         "body": {"results": [{"pars": {"dev_id": "device123", "dev_type": 1}}]}
     }
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
     mock_client.write_gatt_char = AsyncMock()
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
@@ -473,7 +511,6 @@ async def test_protocol_send_pairing_request():
     mock_client.write_gatt_char.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_protocol_send_request_with_ctrl():
     """Test sending request with ctrl parameter."""
     protocol = _BlancoUnitProtocol()
@@ -481,10 +518,7 @@ async def test_protocol_send_request_with_ctrl():
 
     # Mock response
     response_data = {"body": {"results": [{"pars": {"status": "ok"}}]}}
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
     mock_client.write_gatt_char = AsyncMock()
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
@@ -497,7 +531,6 @@ async def test_protocol_send_request_with_ctrl():
     mock_client.write_gatt_char.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_protocol_send_request_without_ctrl():
     """Test sending request without ctrl parameter."""
     protocol = _BlancoUnitProtocol()
@@ -505,10 +538,7 @@ async def test_protocol_send_request_without_ctrl():
 
     # Mock response
     response_data = {"body": {"results": [{"pars": {"status": "ok"}}]}}
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
     mock_client.write_gatt_char = AsyncMock()
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
@@ -550,7 +580,6 @@ def test_extract_device_id_invalid_structure():
     assert _extract_device_id(response) is None
 
 
-@pytest.mark.asyncio
 async def test_validate_pin_success_with_dev_id():
     """Test validate_pin with successful PIN and device ID."""
     mock_client = AsyncMock()
@@ -562,12 +591,9 @@ async def test_validate_pin_success_with_dev_id():
             "meta": {"dev_id": "device123", "dev_type": 1},
         }
     }
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
-    mock_client.write_gatt_char = AsyncMock()
+    mock_client.write_gatt_char = _noop_write
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
 
     validation = await validate_pin(mock_client, "12345")
@@ -577,19 +603,15 @@ async def test_validate_pin_success_with_dev_id():
     assert validation.dev_type == 1
 
 
-@pytest.mark.asyncio
 async def test_validate_pin_wrong_pin_error_code():
     """Test validate_pin with wrong PIN (error code 4)."""
     mock_client = AsyncMock()
 
     # Mock auth error response
     response_data = {"body": {"results": [{"pars": {"errs": [{"err_code": 4}]}}]}}
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
-    mock_client.write_gatt_char = AsyncMock()
+    mock_client.write_gatt_char = _noop_write
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
 
     validation = await validate_pin(mock_client, "99999")
@@ -597,19 +619,15 @@ async def test_validate_pin_wrong_pin_error_code():
     assert validation.is_valid is False
 
 
-@pytest.mark.asyncio
 async def test_validate_pin_no_device_id():
     """Test validate_pin when no device ID is returned."""
     mock_client = AsyncMock()
 
     # Mock response without device ID
     response_data = {"body": {"results": [{"pars": {}}]}}
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
-    mock_client.write_gatt_char = AsyncMock()
+    mock_client.write_gatt_char = _noop_write
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
 
     validation = await validate_pin(mock_client, "12345")
@@ -617,7 +635,6 @@ async def test_validate_pin_no_device_id():
     assert validation.is_valid is False
 
 
-@pytest.mark.asyncio
 async def test_validate_pin_invalid_format():
     """Test validate_pin with invalid PIN format."""
     mock_client = AsyncMock()
@@ -626,7 +643,6 @@ async def test_validate_pin_invalid_format():
         await validate_pin(mock_client, "123")
 
 
-@pytest.mark.asyncio
 async def test_validate_pin_non_digit():
     """Test validate_pin with non-digit PIN."""
     mock_client = AsyncMock()
@@ -635,7 +651,6 @@ async def test_validate_pin_non_digit():
         await validate_pin(mock_client, "abcde")
 
 
-@pytest.mark.asyncio
 async def test_validate_pin_with_provided_protocol():
     """Test validate_pin with provided protocol instance."""
     mock_client = AsyncMock()
@@ -648,12 +663,9 @@ async def test_validate_pin_with_provided_protocol():
             "meta": {"dev_id": "device789", "dev_type": 2},
         }
     }
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
-    mock_client.write_gatt_char = AsyncMock()
+    mock_client.write_gatt_char = _noop_write
     mock_client.read_gatt_char = AsyncMock(return_value=response_packet)
 
     validation = await validate_pin(mock_client, "12345", protocol=protocol)
@@ -668,19 +680,12 @@ async def test_validate_pin_with_provided_protocol():
 # -------------------------------
 
 
-def test_bluetooth_client_init_valid_pin():
+def test_bluetooth_client_init_valid_pin(bt_client, callback_mock):
     """Test BlancoUnitBluetoothClient initialization with valid PIN."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    assert client._pin == "12345"
-    assert client._device == device
-    assert client._connection_callback == callback
-    assert client._session_data is None
+    assert bt_client._pin == "12345"
+    assert bt_client._device.address == "AA:BB:CC:DD:EE:FF"
+    assert bt_client._connection_callback == callback_mock
+    assert bt_client._session_data is None
 
 
 def test_bluetooth_client_init_invalid_pin_length():
@@ -705,208 +710,121 @@ def test_bluetooth_client_init_invalid_pin_format():
         )
 
 
-def test_bluetooth_client_device_id_when_not_connected():
+def test_bluetooth_client_device_id_when_not_connected(bt_client):
     """Test device_id property returns None when not connected."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    assert client.device_id is None
+    assert bt_client.device_id is None
 
 
-def test_bluetooth_client_device_id_when_connected():
+def test_bluetooth_client_device_id_when_connected(bt_client):
     """Test device_id property returns device ID when connected."""
     from custom_components.blanco_unit.client import _BlancoUnitSessionData
 
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     # Mock session data
     mock_client = AsyncMock()
     mock_protocol = MagicMock()
-    client._session_data = _BlancoUnitSessionData(
+    bt_client._session_data = _BlancoUnitSessionData(
         client=mock_client, dev_id="device123", dev_type=1, protocol=mock_protocol
     )
 
-    assert client.device_id == "device123"
+    assert bt_client.device_id == "device123"
 
 
-def test_bluetooth_client_is_connected_when_not_connected():
+def test_bluetooth_client_is_connected_when_not_connected(bt_client):
     """Test is_connected property returns False when not connected."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    assert client.is_connected is False
+    assert bt_client.is_connected is False
 
 
-def test_bluetooth_client_is_connected_when_connected():
+def test_bluetooth_client_is_connected_when_connected(bt_client):
     """Test is_connected property returns True when connected."""
     from custom_components.blanco_unit.client import _BlancoUnitSessionData
 
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     # Mock session data with connected client
     mock_client = AsyncMock()
     mock_client.is_connected = True
     mock_protocol = MagicMock()
-    client._session_data = _BlancoUnitSessionData(
+    bt_client._session_data = _BlancoUnitSessionData(
         client=mock_client, dev_id="device123", dev_type=1, protocol=mock_protocol
     )
 
-    assert client.is_connected is True
+    assert bt_client.is_connected is True
 
 
-@pytest.mark.asyncio
-async def test_bluetooth_client_disconnect_when_connected():
+async def test_bluetooth_client_disconnect_when_connected(bt_client):
     """Test disconnect method when client is connected."""
     from custom_components.blanco_unit.client import _BlancoUnitSessionData
 
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     # Mock session data
     mock_client = AsyncMock()
     mock_protocol = MagicMock()
-    client._session_data = _BlancoUnitSessionData(
+    bt_client._session_data = _BlancoUnitSessionData(
         client=mock_client, dev_id="device123", dev_type=1, protocol=mock_protocol
     )
 
-    await client.disconnect()
+    await bt_client.disconnect()
 
     mock_client.disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_bluetooth_client_disconnect_when_not_connected():
+async def test_bluetooth_client_disconnect_when_not_connected(bt_client):
     """Test disconnect method when client is not connected."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     # Should not raise an error
-    await client.disconnect()
+    await bt_client.disconnect()
 
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_connect_first_time(mock_establish):
+async def test_bluetooth_client_connect_first_time(
+    mock_ble_client, bt_client, callback_mock
+):
     """Test _connect method on first connection."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock pairing response
-    response_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = AsyncMock(return_value=response_packet)
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = AsyncMock(return_value=_PAIRING_PACKET)
 
-    session_data = await client._connect()
+    session_data = await bt_client._connect()
 
     assert session_data.dev_id == "device123"
-    assert client._session_data is not None
-    assert client._session_data.dev_id == "device123"
-    callback.assert_called_once_with(True)
+    assert bt_client._session_data is not None
+    assert bt_client._session_data.dev_id == "device123"
+    callback_mock.assert_called_once_with(True)
 
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_connect_already_connected(mock_establish):
+async def test_bluetooth_client_connect_already_connected(mock_establish, bt_client):
     """Test _connect method when already connected."""
     from custom_components.blanco_unit.client import _BlancoUnitSessionData
 
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     # Pre-populate session data
     mock_ble_client = AsyncMock()
     mock_protocol = MagicMock()
     existing_session = _BlancoUnitSessionData(
         client=mock_ble_client, dev_id="device123", dev_type=1, protocol=mock_protocol
     )
-    client._session_data = existing_session
+    bt_client._session_data = existing_session
 
-    session_data = await client._connect()
+    session_data = await bt_client._connect()
 
     # Should return existing session without establishing new connection
     assert session_data == existing_session
     mock_establish.assert_not_called()
 
 
-def test_bluetooth_client_handle_disconnect():
+def test_bluetooth_client_handle_disconnect(bt_client, callback_mock):
     """Test _handle_disconnect callback."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     # Set session data
     from custom_components.blanco_unit.client import _BlancoUnitSessionData
 
     mock_ble_client = AsyncMock()
     mock_protocol = MagicMock()
-    client._session_data = _BlancoUnitSessionData(
+    bt_client._session_data = _BlancoUnitSessionData(
         client=mock_ble_client, dev_id="device123", dev_type=1, protocol=mock_protocol
     )
 
     # Trigger disconnect
-    client._handle_disconnect(mock_ble_client)
+    bt_client._handle_disconnect(mock_ble_client)
 
-    assert client._session_data is None
-    callback.assert_called_once_with(False)
+    assert bt_client._session_data is None
+    callback_mock.assert_called_once_with(False)
 
 
-@pytest.mark.asyncio
-async def test_bluetooth_client_perform_pairing_success():
+async def test_bluetooth_client_perform_pairing_success(bt_client):
     """Test _perform_pairing with successful authentication."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     mock_ble_client = AsyncMock()
     mock_protocol = _BlancoUnitProtocol()
 
@@ -917,22 +835,18 @@ async def test_bluetooth_client_perform_pairing_success():
             "meta": {"dev_id": "device456", "dev_type": 1},
         }
     }
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
-    mock_ble_client.write_gatt_char = AsyncMock()
+    mock_ble_client.write_gatt_char = _noop_write
     mock_ble_client.read_gatt_char = AsyncMock(return_value=response_packet)
 
-    result = await client._perform_pairing(mock_ble_client, mock_protocol)
+    result = await bt_client._perform_pairing(mock_ble_client, mock_protocol)
 
     assert result.is_valid is True
     assert result.dev_id == "device456"
     assert result.dev_type == 1
 
 
-@pytest.mark.asyncio
 async def test_bluetooth_client_perform_pairing_wrong_pin():
     """Test _perform_pairing with wrong PIN (error code 4)."""
     device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
@@ -947,29 +861,20 @@ async def test_bluetooth_client_perform_pairing_wrong_pin():
 
     # Mock auth error response
     response_data = {"body": {"results": [{"pars": {"errs": [{"err_code": 4}]}}]}}
-    json_str = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + json_str.encode("utf-8") + b"\x00\xff"
-    )
+    response_packet = _frame(_PAIRING_ID, response_data)
 
-    mock_ble_client.write_gatt_char = AsyncMock()
+    mock_ble_client.write_gatt_char = _noop_write
     mock_ble_client.read_gatt_char = AsyncMock(return_value=response_packet)
 
     with pytest.raises(BlancoUnitAuthenticationError, match="Wrong PIN"):
         await client._perform_pairing(mock_ble_client, mock_protocol)
 
 
-@pytest.mark.asyncio
 @patch("custom_components.blanco_unit.client.validate_pin")
-async def test_bluetooth_client_perform_pairing_no_device_id(mock_validate_pin):
+async def test_bluetooth_client_perform_pairing_no_device_id(
+    mock_validate_pin, bt_client
+):
     """Test _perform_pairing when no device ID is returned."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
     mock_ble_client = AsyncMock()
     mock_protocol = _BlancoUnitProtocol()
 
@@ -979,890 +884,359 @@ async def test_bluetooth_client_perform_pairing_no_device_id(mock_validate_pin):
     with pytest.raises(
         BlancoUnitConnectionError, match="No device ID in pairing response"
     ):
-        await client._perform_pairing(mock_ble_client, mock_protocol)
+        await bt_client._perform_pairing(mock_ble_client, mock_protocol)
 
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_execute_transaction_success(mock_establish):
+async def test_bluetooth_client_execute_transaction_success(mock_ble_client, bt_client):
     """Test _execute_transaction with successful response."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock pairing response
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
     # Mock transaction response
     transaction_data = {"body": {"results": [{"pars": {"status": "ok"}}]}, "type": 2}
-    transaction_json = json.dumps(transaction_data)
-    transaction_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00])
-        + transaction_json.encode("utf-8")
-        + b"\x00\xff"
-    )
-
-    # Simulate two reads: first for pairing, second for transaction
-    read_count = 0
+    transaction_packet = _frame(_TXN_ID, transaction_data)
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return transaction_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(
+        _PAIRING_PACKET, transaction_packet
+    )
 
-    response = await client._execute_transaction(
+    response = await bt_client._execute_transaction(
         evt_type=7, ctrl=3, pars={"test": "data"}
     )
 
     assert response["type"] == 2
 
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_execute_transaction_auth_error(mock_establish):
+async def test_bluetooth_client_execute_transaction_auth_error(
+    mock_ble_client, bt_client
+):
     """Test _execute_transaction with authentication error."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock pairing response
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
     # Mock transaction response with auth error
     transaction_data = {"body": {"results": [{"pars": {"errs": [{"err_code": 4}]}}]}}
-    transaction_json = json.dumps(transaction_data)
-    transaction_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00])
-        + transaction_json.encode("utf-8")
-        + b"\x00\xff"
-    )
-
-    # Simulate two reads
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return transaction_packet
+    transaction_packet = _frame(_TXN_ID, transaction_data)
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(
+        _PAIRING_PACKET, transaction_packet
+    )
 
     with pytest.raises(
         BlancoUnitAuthenticationError, match="Authentication error during operation"
     ):
-        await client._execute_transaction(evt_type=7, ctrl=3)
+        await bt_client._execute_transaction(evt_type=7, ctrl=3)
+
+
+@pytest.mark.parametrize(
+    ("method", "pars", "expected"),
+    [
+        pytest.param(
+            "get_system_info",
+            {
+                "sw_ver_comm_con": {"val": "1.0.0"},
+                "sw_ver_elec_con": {"val": "2.0.0"},
+                "sw_ver_main_con": {"val": "3.0.0"},
+                "dev_name": {"val": "Test Device"},
+                "reset_cnt": {"val": 5},
+            },
+            {
+                "sw_ver_comm_con": "1.0.0",
+                "sw_ver_elec_con": "2.0.0",
+                "sw_ver_main_con": "3.0.0",
+                "dev_name": "Test Device",
+                "reset_cnt": 5,
+            },
+            id="system_info",
+        ),
+        pytest.param(
+            "get_settings",
+            {
+                "calib_still_wtr": {"val": 5},
+                "calib_soda_wtr": {"val": 6},
+                "filter_life_tm": {"val": 365},
+                "post_flush_quantity": {"val": 100},
+                "set_point_cooling": {"val": 7},
+                "wtr_hardness": {"val": 4},
+            },
+            {
+                "calib_still_wtr": 5,
+                "calib_soda_wtr": 6,
+                "filter_life_tm": 365,
+                "post_flush_quantity": 100,
+                "set_point_cooling": 7,
+                "wtr_hardness": 4,
+            },
+            id="settings",
+        ),
+        pytest.param(
+            "get_status",
+            {
+                "tap_state": {"val": 2},
+                "filter_rest": {"val": 80},
+                "co2_rest": {"val": 90},
+                "wtr_disp_active": {"val": True},
+                "firm_upd_avlb": {"val": False},
+                "set_point_cooling": {"val": 7},
+                "clean_mode_state": {"val": 1},
+                "err_bits": {"val": 0},
+            },
+            {
+                "tap_state": 2,
+                "filter_rest": 80,
+                "co2_rest": 90,
+                "wtr_disp_active": True,
+                "firm_upd_avlb": False,
+            },
+            id="status",
+        ),
+        pytest.param(
+            "get_device_identity",
+            {"ser_no": "123456", "serv_code": "ABCDEF"},
+            {"serial_no": "123456", "service_code": "ABCDEF"},
+            id="device_identity",
+        ),
+        pytest.param(
+            "get_wifi_info",
+            {
+                "cloud_connect": {"val": True},
+                "ssid": {"val": "MyWiFi"},
+                "signal": {"val": -50},
+                "ip": {"val": "192.168.1.100"},
+                "b_mac": {"val": "AA:BB:CC:DD:EE:FF"},
+                "w_mac": {"val": "11:22:33:44:55:66"},
+                "default_gateway": {"val": "192.168.1.1"},
+                "default_gateway_mac": {"val": "AA:BB:CC:DD:EE:00"},
+                "subnet": {"val": "255.255.255.0"},
+            },
+            {
+                "cloud_connect": True,
+                "ssid": "MyWiFi",
+                "signal": -50,
+                "ip": "192.168.1.100",
+            },
+            id="wifi_info",
+        ),
+    ],
+)
+async def test_bluetooth_client_getters(
+    mock_ble_client, bt_client, method, pars, expected
+):
+    """Test the getter methods parse the pars of a transaction response."""
+    response_packet = _frame(_TXN_ID, {"body": {"results": [{"pars": pars}]}})
 
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_get_system_info(mock_establish):
-    """Test get_system_info method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
+    result = await getattr(bt_client, method)()
 
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
+    for attr, value in expected.items():
+        assert getattr(result, attr) == value
 
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
 
+async def test_bluetooth_client_set_temperature_success(mock_ble_client, bt_client):
+    """Test set_temperature method with valid temperature."""
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
+    response_data = {"type": 2}
+    response_packet = _frame(_TXN_ID, response_data)
 
-    system_data = {
-        "body": {
-            "results": [
-                {
-                    "pars": {
-                        "sw_ver_comm_con": {"val": "1.0.0"},
-                        "sw_ver_elec_con": {"val": "2.0.0"},
-                        "sw_ver_main_con": {"val": "3.0.0"},
-                        "dev_name": {"val": "Test Device"},
-                        "reset_cnt": {"val": 5},
-                    }
-                }
-            ]
-        }
-    }
-    system_json = json.dumps(system_data)
-    system_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + system_json.encode("utf-8") + b"\x00\xff"
-    )
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
+
+    result = await bt_client.set_temperature(cooling_celsius=7)
 
-    read_count = 0
+    assert result is True
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return system_packet
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+@pytest.mark.parametrize(
+    ("method", "kwargs", "match"),
+    [
+        pytest.param(
+            "set_temperature",
+            {"cooling_celsius": 3},
+            _RE_TEMP,
+            id="temperature_too_low",
+        ),
+        pytest.param(
+            "set_temperature",
+            {"cooling_celsius": 11},
+            _RE_TEMP,
+            id="temperature_too_high",
+        ),
+        pytest.param(
+            "dispense_water",
+            {"amount_ml": 1, "co2_intensity": 1},
+            _RE_AMOUNT,
+            id="amount_too_low",
+        ),
+        pytest.param(
+            "dispense_water",
+            {"amount_ml": 500, "co2_intensity": 5},
+            _RE_CO2,
+            id="invalid_co2_intensity",
+        ),
+    ],
+)
+async def test_bluetooth_client_invalid_arguments(bt_client, method, kwargs, match):
+    """Test client methods reject out-of-range arguments before connecting."""
+    with pytest.raises(ValueError, match=match):
+        await getattr(bt_client, method)(**kwargs)
 
-    info = await client.get_system_info()
 
-    assert info.sw_ver_comm_con == "1.0.0"
-    assert info.sw_ver_elec_con == "2.0.0"
-    assert info.sw_ver_main_con == "3.0.0"
-    assert info.dev_name == "Test Device"
-    assert info.reset_cnt == 5
+async def test_bluetooth_client_set_water_hardness_success(mock_ble_client, bt_client):
+    """Test set_water_hardness method."""
+    # Mock responses
+    response_data = {"type": 2}
+    response_packet = _frame(_TXN_ID, response_data)
 
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_get_settings(mock_establish):
-    """Test get_settings method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
+    result = await bt_client.set_water_hardness(level=5)
 
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
+    assert result is True
 
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
 
+async def test_bluetooth_client_change_pin_success(mock_ble_client, bt_client):
+    """Test change_pin method with successful PIN change."""
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    settings_data = {
-        "body": {
-            "results": [
-                {
-                    "pars": {
-                        "calib_still_wtr": {"val": 5},
-                        "calib_soda_wtr": {"val": 6},
-                        "filter_life_tm": {"val": 365},
-                        "post_flush_quantity": {"val": 100},
-                        "set_point_cooling": {"val": 7},
-                        "wtr_hardness": {"val": 4},
-                    }
-                }
-            ]
-        }
-    }
-    settings_json = json.dumps(settings_data)
-    settings_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + settings_json.encode("utf-8") + b"\x00\xff"
-    )
+    response_data = {"type": 2}
+    response_packet = _frame(_TXN_ID, response_data)
 
-    read_count = 0
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return settings_packet
+    result = await bt_client.change_pin(new_pin="54321")
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+    assert result is True
+    assert bt_client._pin == "54321"
 
-    settings = await client.get_settings()
 
-    assert settings.calib_still_wtr == 5
-    assert settings.calib_soda_wtr == 6
-    assert settings.filter_life_tm == 365
-    assert settings.post_flush_quantity == 100
-    assert settings.set_point_cooling == 7
-    assert settings.wtr_hardness == 4
+async def test_bluetooth_client_change_pin_failure(mock_ble_client, bt_client):
+    """Test change_pin method when PIN change fails."""
+    # Mock responses
+    response_data = {"type": 1}  # Not type 2 = failure
+    response_packet = _frame(_TXN_ID, response_data)
 
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_get_status(mock_establish):
-    """Test get_status method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
+    result = await bt_client.change_pin(new_pin="54321")
 
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
+    assert result is False
+    assert bt_client._pin == "12345"  # PIN should not change
 
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
 
+async def test_bluetooth_client_dispense_water_success(mock_ble_client, bt_client):
+    """Test dispense_water method with valid parameters."""
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    status_data = {
-        "body": {
-            "results": [
-                {
-                    "pars": {
-                        "tap_state": {"val": 2},
-                        "filter_rest": {"val": 80},
-                        "co2_rest": {"val": 90},
-                        "wtr_disp_active": {"val": True},
-                        "firm_upd_avlb": {"val": False},
-                        "set_point_cooling": {"val": 7},
-                        "clean_mode_state": {"val": 1},
-                        "err_bits": {"val": 0},
-                    }
-                }
-            ]
-        }
-    }
-    status_json = json.dumps(status_data)
-    status_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + status_json.encode("utf-8") + b"\x00\xff"
-    )
+    response_data = {"type": 2}
+    response_packet = _frame(_TXN_ID, response_data)
 
-    read_count = 0
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return status_packet
+    result = await bt_client.dispense_water(amount_ml=500, co2_intensity=2)
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+    assert result is True
 
-    status = await client.get_status()
 
-    assert status.tap_state == 2
-    assert status.filter_rest == 80
-    assert status.co2_rest == 90
-    assert status.wtr_disp_active is True
-    assert status.firm_upd_avlb is False
+async def test_bluetooth_client_set_calibration_still(mock_ble_client, bt_client):
+    """Test set_calibration_still method."""
+    # Mock responses
+    response_data = {"type": 2}
+    response_packet = _frame(_TXN_ID, response_data)
 
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_get_device_identity(mock_establish):
-    """Test get_device_identity method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
+    result = await bt_client.set_calibration_still(amount=5)
 
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
+    assert result is True
 
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
 
+async def test_bluetooth_client_set_calibration_soda(mock_ble_client, bt_client):
+    """Test set_calibration_soda method."""
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    identity_data = {
-        "body": {"results": [{"pars": {"ser_no": "123456", "serv_code": "ABCDEF"}}]}
-    }
-    identity_json = json.dumps(identity_data)
-    identity_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + identity_json.encode("utf-8") + b"\x00\xff"
-    )
+    response_data = {"type": 2}
+    response_packet = _frame(_TXN_ID, response_data)
 
-    read_count = 0
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return identity_packet
+    result = await bt_client.set_calibration_soda(amount=7)
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+    assert result is True
 
-    identity = await client.get_device_identity()
 
-    assert identity.serial_no == "123456"
-    assert identity.service_code == "ABCDEF"
+class _BrokenDict:
+    """Mapping that claims to contain every key but fails on lookup."""
 
+    def __contains__(self, key):
+        return True  # Pretend the key exists
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_get_wifi_info(mock_establish):
-    """Test get_wifi_info method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
+    def __getitem__(self, key):
+        raise KeyError("Broken!")  # But raise KeyError when accessing
 
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
 
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
+_BROKEN_DICT = _BrokenDict()
 
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
 
-    wifi_data = {
+def test_extract_device_id_exception_handling():
+    """Test _extract_device_id with TypeError/KeyError exception."""
+    # Test with response where meta is an object that doesn't support 'in' operator
+    # Numbers, None, etc. will raise TypeError when using 'in' operator
+    response = {
         "body": {
-            "results": [
-                {
-                    "pars": {
-                        "cloud_connect": {"val": True},
-                        "ssid": {"val": "MyWiFi"},
-                        "signal": {"val": -50},
-                        "ip": {"val": "192.168.1.100"},
-                        "b_mac": {"val": "AA:BB:CC:DD:EE:FF"},
-                        "w_mac": {"val": "11:22:33:44:55:66"},
-                        "default_gateway": {"val": "192.168.1.1"},
-                        "default_gateway_mac": {"val": "AA:BB:CC:DD:EE:00"},
-                        "subnet": {"val": "255.255.255.0"},
-                    }
-                }
-            ]
+            "meta": 123  # This will cause TypeError on line 718: if "dev_id" in meta
         }
     }
-    wifi_json = json.dumps(wifi_data)
-    wifi_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + wifi_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
+    assert _extract_device_id(response) is None
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return wifi_packet
+    # Test with response where accessing meta["dev_id"] raises KeyError
+    # Even though "dev_id" is in meta, accessing it could raise KeyError if meta is a custom class
+    assert _extract_device_id({"body": {"meta": _BROKEN_DICT}}) is None
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
 
-    wifi_info = await client.get_wifi_info()
+# -------------------------------
+# WiFi & Device Management Pars Tests
+# -------------------------------
 
-    assert wifi_info.cloud_connect is True
-    assert wifi_info.ssid == "MyWiFi"
-    assert wifi_info.signal == -50
-    assert wifi_info.ip == "192.168.1.100"
 
+@pytest.mark.parametrize(
+    ("pars", "expected"),
+    [
+        pytest.param(
+            _ConnectWifiPars(ssid="TestSSID", password="pass123"),
+            {"ssid": {"val": "TestSSID"}, "password": {"val": "pass123"}},
+            id="connect_wifi",
+        ),
+        pytest.param(
+            _ConnectWifiPars(ssid="", password=""),
+            {"ssid": {"val": ""}, "password": {"val": ""}},
+            id="connect_wifi_empty",
+        ),
+        pytest.param(
+            _AllowCloudServicesPars(),
+            {"rca_id": ""},
+            id="allow_cloud_services_default",
+        ),
+        pytest.param(
+            _AllowCloudServicesPars(rca_id="some_id"),
+            {"rca_id": "some_id"},
+            id="allow_cloud_services_with_id",
+        ),
+    ],
+)
+def test_device_management_pars_to_pars(pars, expected):
+    """Test to_pars() of the WiFi and cloud services parameter classes."""
+    assert pars.to_pars() == expected
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_set_temperature_success(mock_establish):
-    """Test set_temperature method with valid temperature."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
 
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
+# -------------------------------
+# WiFi & Device Management Client Tests
+# -------------------------------
 
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
 
+async def test_bluetooth_client_scan_wifi_networks(mock_ble_client, bt_client):
+    """Test scan_wifi_networks method returns list of networks."""
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.set_temperature(cooling_celsius=7)
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-async def test_bluetooth_client_set_temperature_invalid_low():
-    """Test set_temperature with temperature too low."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    with pytest.raises(ValueError, match="Temperature must be between 4 and 10"):
-        await client.set_temperature(cooling_celsius=3)
-
-
-@pytest.mark.asyncio
-async def test_bluetooth_client_set_temperature_invalid_high():
-    """Test set_temperature with temperature too high."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    with pytest.raises(ValueError, match="Temperature must be between 4 and 10"):
-        await client.set_temperature(cooling_celsius=11)
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_set_water_hardness_success(mock_establish):
-    """Test set_water_hardness method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.set_water_hardness(level=5)
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_change_pin_success(mock_establish):
-    """Test change_pin method with successful PIN change."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.change_pin(new_pin="54321")
-
-    assert result is True
-    assert client._pin == "54321"
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_change_pin_failure(mock_establish):
-    """Test change_pin method when PIN change fails."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 1}  # Not type 2 = failure
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.change_pin(new_pin="54321")
-
-    assert result is False
-    assert client._pin == "12345"  # PIN should not change
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_dispense_water_success(mock_establish):
-    """Test dispense_water method with valid parameters."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.dispense_water(amount_ml=500, co2_intensity=2)
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-async def test_bluetooth_client_dispense_water_invalid_amount_low():
-    """Test dispense_water with amount too low."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    with pytest.raises(ValueError, match="Amount must be at least 50ml"):
-        await client.dispense_water(amount_ml=1, co2_intensity=1)
-
-
-@pytest.mark.asyncio
-async def test_bluetooth_client_dispense_water_invalid_intensity():
-    """Test dispense_water with invalid CO2 intensity."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    with pytest.raises(ValueError, match="CO2 intensity must be"):
-        await client.dispense_water(amount_ml=500, co2_intensity=5)
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_set_calibration_still(mock_establish):
-    """Test set_calibration_still method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.set_calibration_still(amount=5)
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_set_calibration_soda(mock_establish):
-    """Test set_calibration_soda method."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.set_calibration_soda(amount=7)
-
-    assert result is True
-
-
-def test_extract_device_id_exception_handling():
-    """Test _extract_device_id with TypeError/KeyError exception."""
-    # Test with response where meta is an object that doesn't support 'in' operator
-    # Numbers, None, etc. will raise TypeError when using 'in' operator
-    response = {
-        "body": {
-            "meta": 123  # This will cause TypeError on line 718: if "dev_id" in meta
-        }
-    }
-    assert _extract_device_id(response) is None
-
-    # Test with response where accessing meta["dev_id"] raises KeyError
-    # Even though "dev_id" is in meta, accessing it could raise KeyError if meta is a custom class
-    class BrokenDict:
-        def __contains__(self, key):
-            return True  # Pretend the key exists
-
-        def __getitem__(self, key):
-            raise KeyError("Broken!")  # But raise KeyError when accessing
-
-    response2 = {"body": {"meta": BrokenDict()}}
-    assert _extract_device_id(response2) is None
-
-
-# -------------------------------
-# WiFi & Device Management Pars Tests
-# -------------------------------
-
-
-def test_connect_wifi_pars_to_pars():
-    """Test _ConnectWifiPars.to_pars() with valid SSID and password."""
-    pars = _ConnectWifiPars(ssid="TestSSID", password="pass123")
-    result = pars.to_pars()
-    assert result == {"ssid": {"val": "TestSSID"}, "password": {"val": "pass123"}}
-
-
-def test_connect_wifi_pars_to_pars_empty():
-    """Test _ConnectWifiPars.to_pars() with empty strings."""
-    pars = _ConnectWifiPars(ssid="", password="")
-    result = pars.to_pars()
-    assert result == {"ssid": {"val": ""}, "password": {"val": ""}}
-
-
-def test_allow_cloud_services_pars_to_pars_default():
-    """Test _AllowCloudServicesPars.to_pars() with default rca_id."""
-    pars = _AllowCloudServicesPars()
-    result = pars.to_pars()
-    assert result == {"rca_id": ""}
-
-
-def test_allow_cloud_services_pars_to_pars_with_id():
-    """Test _AllowCloudServicesPars.to_pars() with specific rca_id."""
-    pars = _AllowCloudServicesPars(rca_id="some_id")
-    result = pars.to_pars()
-    assert result == {"rca_id": "some_id"}
-
-
-# -------------------------------
-# WiFi & Device Management Client Tests
-# -------------------------------
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_scan_wifi_networks(mock_establish):
-    """Test scan_wifi_networks method returns list of networks."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
     scan_data = {
         "body": {
             "pars": {
@@ -1873,24 +1247,12 @@ async def test_bluetooth_client_scan_wifi_networks(mock_establish):
             }
         }
     }
-    scan_json = json.dumps(scan_data)
-    scan_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + scan_json.encode("utf-8") + b"\x00\xff"
-    )
+    scan_packet = _frame(_TXN_ID, scan_data)
 
-    read_count = 0
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, scan_packet)
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return scan_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.scan_wifi_networks()
+    result = await bt_client.scan_wifi_networks()
 
     assert isinstance(result, list)
     assert len(result) == 2
@@ -1899,278 +1261,49 @@ async def test_bluetooth_client_scan_wifi_networks(mock_establish):
     assert result[0].auth_mode == 3
 
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_scan_wifi_networks_empty(mock_establish):
+async def test_bluetooth_client_scan_wifi_networks_empty(mock_ble_client, bt_client):
     """Test scan_wifi_networks method with empty access point list."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
     scan_data = {"body": {"pars": {"aps": []}}}
-    scan_json = json.dumps(scan_data)
-    scan_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + scan_json.encode("utf-8") + b"\x00\xff"
-    )
+    scan_packet = _frame(_TXN_ID, scan_data)
 
-    read_count = 0
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, scan_packet)
 
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return scan_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.scan_wifi_networks()
+    result = await bt_client.scan_wifi_networks()
 
     assert isinstance(result, list)
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_connect_wifi_success(mock_establish):
-    """Test connect_wifi method with successful connection."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.connect_wifi("TestSSID", "password123")
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_disconnect_wifi_success(mock_establish):
-    """Test disconnect_wifi method with successful disconnection."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.disconnect_wifi()
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_allow_cloud_services_success(mock_establish):
-    """Test allow_cloud_services method with default rca_id."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.allow_cloud_services()
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_allow_cloud_services_with_rca_id(mock_establish):
-    """Test allow_cloud_services method with specific rca_id."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
-    # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
-
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
-
-    result = await client.allow_cloud_services(rca_id="test_id")
-
-    assert result is True
-
-
-@pytest.mark.asyncio
-@patch("custom_components.blanco_unit.client.establish_connection")
-async def test_bluetooth_client_factory_reset_success(mock_establish):
-    """Test factory_reset method with successful reset."""
-    device = BLEDevice(address="AA:BB:CC:DD:EE:FF", name="Test Device", details={})
-    callback = MagicMock()
-
-    client = BlancoUnitBluetoothClient(
-        pin="12345", device=device, connection_callback=callback
-    )
-
-    # Mock establish_connection
-    mock_ble_client = AsyncMock()
-    mock_ble_client.is_connected = True
-    mock_establish.return_value = mock_ble_client
-
+@pytest.mark.parametrize(
+    ("method", "args", "kwargs"),
+    [
+        pytest.param(
+            "connect_wifi", ("TestSSID", "password123"), {}, id="connect_wifi"
+        ),
+        pytest.param("disconnect_wifi", (), {}, id="disconnect_wifi"),
+        pytest.param("allow_cloud_services", (), {}, id="allow_cloud_services"),
+        pytest.param(
+            "allow_cloud_services",
+            (),
+            {"rca_id": "test_id"},
+            id="allow_cloud_services_with_rca_id",
+        ),
+        pytest.param("factory_reset", (), {}, id="factory_reset"),
+    ],
+)
+async def test_bluetooth_client_device_management_success(
+    mock_ble_client, bt_client, method, args, kwargs
+):
+    """Test WiFi and device management methods return True on success."""
     # Mock responses
-    pairing_data = {"body": {"meta": {"dev_id": "device123", "dev_type": 1}}}
-    pairing_json = json.dumps(pairing_data)
-    pairing_packet = (
-        bytes([0xFF, 0x00, 1, 10, 0x00]) + pairing_json.encode("utf-8") + b"\x00\xff"
-    )
-
     response_data = {"type": 2}
-    response_json = json.dumps(response_data)
-    response_packet = (
-        bytes([0xFF, 0x00, 1, 11, 0x00]) + response_json.encode("utf-8") + b"\x00\xff"
-    )
-
-    read_count = 0
-
-    async def mock_read(*args, **kwargs):
-        nonlocal read_count
-        read_count += 1
-        if read_count == 1:
-            return pairing_packet
-        return response_packet
+    response_packet = _frame(_TXN_ID, response_data)
 
-    mock_ble_client.write_gatt_char = AsyncMock()
-    mock_ble_client.read_gatt_char = mock_read
+    mock_ble_client.write_gatt_char = _noop_write
+    mock_ble_client.read_gatt_char = _make_read_stub(_PAIRING_PACKET, response_packet)
 
-    result = await client.factory_reset()
+    result = await getattr(bt_client, method)(*args, **kwargs)
 
     assert result is True
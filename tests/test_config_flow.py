@@ -1,5 +1,6 @@
 """Tests for the Blanco Unit config flow."""
 
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -7,6 +8,7 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.blanco_unit.client import PinValidationResult
+from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
 from custom_components.blanco_unit.const import (
     CONF_ERROR,
     CONF_MAC,
@@ -19,9 +21,10 @@ from homeassistant.config_entries import (
     SOURCE_REAUTH,
     SOURCE_RECONFIGURE,
     SOURCE_USER,
+    ConfigFlowResult,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import AbortFlow, FlowResultType
 
 MOCKED_CONF_MAC = "AA:BB:CC:DD:EE:FF"
 MOCKED_CONF_NAME = "Test Blanco Unit"
@@ -34,219 +37,203 @@ MOCKED_CONFIG: dict[str, Any] = {
     CONF_PIN: MOCKED_CONF_PIN,
 }
 
+INVALID_MAC_CONFIG: dict[str, Any] = {**MOCKED_CONFIG, CONF_MAC: "INVALID-MAC"}
+INVALID_PIN_CONFIG: dict[str, Any] = {**MOCKED_CONFIG, CONF_PIN: "123"}  # 3 digits
+NON_NUMERIC_PIN_CONFIG: dict[str, Any] = {**MOCKED_CONFIG, CONF_PIN: "abc"}
+RECONFIGURE_CONFIG: dict[str, Any] = {**MOCKED_CONFIG, CONF_NAME: "New Name"}
+PIN_ONLY_INPUT: dict[str, Any] = {CONF_PIN: MOCKED_CONF_PIN}
 
-@pytest.fixture
-def mock_bluetooth_device():
-    """Create a mock Bluetooth device."""
-    device = AsyncMock()
-    device.address = MOCKED_CONF_MAC
-    device.name = MOCKED_CONF_NAME
-    return device
-
+PATCH_SETUP_ENTRY = "custom_components.blanco_unit.async_setup_entry"
+PATCH_VALIDATE_PIN = "custom_components.blanco_unit.config_flow.validate_pin"
+PATCH_ESTABLISH_CONNECTION = (
+    "custom_components.blanco_unit.config_flow.establish_connection"
+)
+PATCH_DEVICE_FROM_ADDRESS = (
+    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
+)
 
-@pytest.fixture
-def mock_bleak_client():
-    """Create a mock Bleak client."""
-    client = AsyncMock()
-    client.is_connected = True
-    client.disconnect = AsyncMock()
-    return client
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_setup_entry():
+    """Skip setting up the entries created or reloaded by the flows."""
+    with patch(PATCH_SETUP_ENTRY, return_value=True) as mock:
+        yield mock
 
-@pytest.fixture
-def mock_discovery():
-    """Mock Bluetooth discovery info."""
-    discovery = AsyncMock()
-    discovery.address = MOCKED_CONF_MAC
-    discovery.name = MOCKED_CONF_NAME
-    return discovery
 
+@pytest.fixture(scope="session")
+def mock_bluetooth_device():
+    """Create a mock Bluetooth device shared by all tests."""
+    return SimpleNamespace(
+        address=MOCKED_CONF_MAC, name=MOCKED_CONF_NAME, details=SimpleNamespace()
+    )
 
-# -------------------------------
-# User Flow Tests
-# -------------------------------
 
+@pytest.fixture(scope="session")
+def mock_bleak_client():
+    """Create a mock Bleak client shared by all tests."""
+    return AsyncMock(is_connected=True)
+
+
+@pytest.fixture(scope="session")
+def mock_discovery(mock_bluetooth_device):
+    """Mock Bluetooth discovery info shared by all tests."""
+    return SimpleNamespace(
+        address=MOCKED_CONF_MAC,
+        name=MOCKED_CONF_NAME,
+        advertisement=None,
+        device=mock_bluetooth_device,
+    )
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
-async def test_user_flow_success(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
-    hass: HomeAssistant,
-    mock_bluetooth_device,
-    mock_bleak_client,
-) -> None:
-    """Test successful user configuration flow."""
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.return_value = PinValidationResult(True, "test_device_id", 2)
 
-    # Initialize flow
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
+@pytest.fixture(autouse=True)
+def patched_flow_deps(
+    monkeypatch: pytest.MonkeyPatch, mock_bluetooth_device, mock_bleak_client
+) -> SimpleNamespace:
+    """Patch the config flow's BLE dependencies with a successful default setup."""
+    deps = SimpleNamespace(
+        device=MagicMock(return_value=mock_bluetooth_device),
+        connect=AsyncMock(return_value=mock_bleak_client),
+        validate=AsyncMock(
+            return_value=PinValidationResult(True, MOCKED_CONF_DEV_ID, 2)
+        ),
     )
-    assert flow_result["type"] is FlowResultType.FORM
-    assert flow_result["step_id"] == "user"
+    monkeypatch.setattr(PATCH_DEVICE_FROM_ADDRESS, deps.device)
+    monkeypatch.setattr(PATCH_ESTABLISH_CONNECTION, deps.connect)
+    monkeypatch.setattr(PATCH_VALIDATE_PIN, deps.validate)
+    return deps
 
-    # Configure with valid data
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        MOCKED_CONFIG,
-    )
 
-    mock_validate_pin.assert_awaited_once()
+@pytest.fixture
+def flow(hass: HomeAssistant) -> BlancoUnitConfigFlow:
+    """Create a config flow bound to the test Home Assistant instance."""
+    config_flow = BlancoUnitConfigFlow()
+    config_flow.hass = hass
+    config_flow.handler = DOMAIN
+    return config_flow
 
-    assert configure_result["type"] is FlowResultType.CREATE_ENTRY
-    assert configure_result["title"] == MOCKED_CONF_NAME
-    assert configure_result["data"][CONF_MAC] == MOCKED_CONF_MAC
-    assert configure_result["data"][CONF_PIN] == MOCKED_CONF_PIN
 
+@pytest.fixture(scope="module")
+def validate_flow() -> BlancoUnitConfigFlow:
+    """Create a config flow with a mocked hass shared by the validation tests."""
+    config_flow = BlancoUnitConfigFlow()
+    config_flow.hass = MagicMock()
+    return config_flow
 
-async def test_user_flow_already_configured(hass: HomeAssistant) -> None:
-    """Test user flow aborts when device is already configured."""
+
+@pytest.fixture(scope="module")
+def form_flow() -> BlancoUnitConfigFlow:
+    """Create an unbound config flow shared by the form schema tests."""
+    return BlancoUnitConfigFlow()
+
+
+@pytest.fixture
+def preconfigured_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a config entry for the mocked device to Home Assistant."""
     entry = MockConfigEntry(
         domain=DOMAIN,
         unique_id=MOCKED_CONF_MAC,
         data=MOCKED_CONFIG,
     )
     entry.add_to_hass(hass)
+    return entry
 
-    with (
-        patch(
-            "custom_components.blanco_unit.config_flow.validate_pin",
-            return_value=PinValidationResult(True, MOCKED_CONF_DEV_ID, 2),
-        ),
-        patch(
-            "custom_components.blanco_unit.config_flow.establish_connection",
-            return_value=AsyncMock(is_connected=True, disconnect=AsyncMock()),
-        ),
-        patch(
-            "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address",
-            return_value=AsyncMock(address=MOCKED_CONF_MAC, name=MOCKED_CONF_NAME),
-        ),
-    ):
-        flow_result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": SOURCE_USER}
-        )
-
-        configure_result = await hass.config_entries.flow.async_configure(
-            flow_result["flow_id"],
-            MOCKED_CONFIG,
-        )
-
-        assert configure_result["type"] is FlowResultType.ABORT
-        assert configure_result["reason"] == "already_configured"
 
+async def _submit_flow(
+    hass: HomeAssistant, context: dict[str, Any], user_input: dict[str, Any]
+) -> ConfigFlowResult:
+    """Start a config flow, check its first form and submit the user input."""
+    flow_result = await hass.config_entries.flow.async_init(DOMAIN, context=context)
+    assert flow_result["type"] is FlowResultType.FORM
+    assert flow_result["step_id"] == context["source"]
 
-async def test_user_flow_invalid_mac(hass: HomeAssistant) -> None:
-    """Test user flow with invalid MAC address."""
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        {**MOCKED_CONFIG, CONF_MAC: "INVALID-MAC"},
+    return await hass.config_entries.flow.async_configure(
+        flow_result["flow_id"], user_input
     )
 
-    assert configure_result["type"] is FlowResultType.FORM
-    assert configure_result["errors"][CONF_ERROR] == "invalid_mac_code"
-
-
-async def test_user_flow_invalid_pin_format(hass: HomeAssistant) -> None:
-    """Test user flow with invalid PIN format."""
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
 
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        {**MOCKED_CONFIG, CONF_PIN: "123"},  # Only 3 digits
-    )
-
-    assert configure_result["type"] is FlowResultType.FORM
-    assert configure_result["errors"][CONF_ERROR] == "invalid_pin_format"
+# -------------------------------
+# User Flow Tests
+# -------------------------------
 
 
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
-async def test_user_flow_device_not_found(
-    mock_device_from_address: AsyncMock,
+async def test_user_flow_success(
     hass: HomeAssistant,
+    patched_flow_deps: SimpleNamespace,
 ) -> None:
-    """Test user flow when device is not found."""
-    mock_device_from_address.return_value = None
-
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
+    """Test successful user configuration flow."""
+    configure_result = await _submit_flow(hass, {"source": SOURCE_USER}, MOCKED_CONFIG)
 
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        MOCKED_CONFIG,
-    )
+    patched_flow_deps.validate.assert_awaited_once()
 
-    assert configure_result["type"] is FlowResultType.FORM
-    assert configure_result["errors"][CONF_ERROR] == "error_device_not_found"
+    assert configure_result["type"] is FlowResultType.CREATE_ENTRY
+    assert configure_result["title"] == MOCKED_CONF_NAME
+    assert configure_result["data"][CONF_MAC] == MOCKED_CONF_MAC
+    assert configure_result["data"][CONF_PIN] == MOCKED_CONF_PIN
 
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
-async def test_user_flow_invalid_authentication(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
-    hass: HomeAssistant,
-    mock_bluetooth_device,
-    mock_bleak_client,
+async def test_user_flow_already_configured(
+    flow: BlancoUnitConfigFlow,
+    preconfigured_entry: MockConfigEntry,
 ) -> None:
-    """Test user flow with invalid authentication."""
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.return_value = PinValidationResult(False, "devId", 2)
-
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
+    """Test user flow aborts when device is already configured."""
+    flow.context = {"source": SOURCE_USER}
 
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        MOCKED_CONFIG,
-    )
+    with pytest.raises(AbortFlow) as exc_info:
+        await flow.async_step_user(MOCKED_CONFIG)
 
-    assert configure_result["type"] is FlowResultType.FORM
-    assert configure_result["errors"][CONF_ERROR] == "error_invalid_authentication"
+    assert exc_info.value.reason == "already_configured"
 
 
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
+@pytest.mark.parametrize(
+    ("user_input", "overrides", "expected_error"),
+    [
+        pytest.param(
+            INVALID_MAC_CONFIG,
+            {},
+            "invalid_mac_code",
+            id="invalid_mac",
+        ),
+        pytest.param(
+            INVALID_PIN_CONFIG,
+            {},
+            "invalid_pin_format",
+            id="invalid_pin_format",
+        ),
+        pytest.param(
+            MOCKED_CONFIG,
+            {"device": {"return_value": None}},
+            "error_device_not_found",
+            id="device_not_found",
+        ),
+        pytest.param(
+            MOCKED_CONFIG,
+            {"validate": {"return_value": PinValidationResult(False, "devId", 2)}},
+            "error_invalid_authentication",
+            id="invalid_authentication",
+        ),
+        pytest.param(
+            MOCKED_CONFIG,
+            {"device": {"side_effect": Exception("Unknown error")}},
+            "error_unknown",
+            id="unknown_error",
+        ),
+    ],
 )
-async def test_user_flow_unknown_error(
-    mock_device_from_address: AsyncMock,
+async def test_user_flow_errors(
     hass: HomeAssistant,
+    patched_flow_deps: SimpleNamespace,
+    user_input: dict[str, Any],
+    overrides: dict[str, dict[str, Any]],
+    expected_error: str,
 ) -> None:
-    """Test user flow with unknown error."""
-    mock_device_from_address.side_effect = Exception("Unknown error")
-
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
+    """Test user flow shows the form again with an error for invalid input."""
+    for name, attrs in overrides.items():
+        getattr(patched_flow_deps, name).configure_mock(**attrs)
 
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        MOCKED_CONFIG,
-    )
+    configure_result = await _submit_flow(hass, {"source": SOURCE_USER}, user_input)
 
     assert configure_result["type"] is FlowResultType.FORM
-    assert configure_result["errors"][CONF_ERROR] == "error_unknown"
+    assert configure_result["errors"][CONF_ERROR] == expected_error
 
 
 # -------------------------------
@@ -270,163 +257,85 @@ async def test_bluetooth_discovery(
 
 
 async def test_bluetooth_discovery_already_configured(
-    hass: HomeAssistant,
+    flow: BlancoUnitConfigFlow,
+    preconfigured_entry: MockConfigEntry,
     mock_discovery,
 ) -> None:
     """Test Bluetooth discovery when device is already configured."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        unique_id=MOCKED_CONF_MAC,
-        data=MOCKED_CONFIG,
-    )
-    entry.add_to_hass(hass)
+    flow.context = {"source": SOURCE_BLUETOOTH}
 
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_BLUETOOTH},
-        data=mock_discovery,
-    )
+    with pytest.raises(AbortFlow) as exc_info:
+        await flow.async_step_bluetooth(mock_discovery)
 
-    assert flow_result["type"] is FlowResultType.ABORT
-    assert flow_result["reason"] == "already_configured"
+    assert exc_info.value.reason == "already_configured"
 
 
 # -------------------------------
-# Reauth Flow Tests
+# Reauth and Reconfigure Flow Tests
 # -------------------------------
 
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
+@pytest.mark.parametrize(
+    ("source", "user_input", "expected_reason"),
+    [
+        pytest.param(SOURCE_REAUTH, MOCKED_CONFIG, "reauth_successful", id="reauth"),
+        pytest.param(
+            SOURCE_RECONFIGURE,
+            RECONFIGURE_CONFIG,
+            "reconfigure_successful",
+            id="reconfigure",
+        ),
+    ],
 )
-async def test_reauth_flow_success(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
+async def test_entry_update_flow_success(
     hass: HomeAssistant,
-    mock_bluetooth_device,
-    mock_bleak_client,
+    preconfigured_entry: MockConfigEntry,
+    source: str,
+    user_input: dict[str, Any],
+    expected_reason: str,
 ) -> None:
-    """Test successful reauth flow."""
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.return_value = PinValidationResult(True, MOCKED_CONF_DEV_ID, 2)
-
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        unique_id=MOCKED_CONF_MAC,
-        data=MOCKED_CONFIG,
-    )
-    entry.add_to_hass(hass)
-
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_REAUTH, "entry_id": entry.entry_id},
-    )
-
-    assert flow_result["type"] is FlowResultType.FORM
-
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        MOCKED_CONFIG,
+    """Test successful reauth and reconfigure flows."""
+    configure_result = await _submit_flow(
+        hass,
+        {"source": source, "entry_id": preconfigured_entry.entry_id},
+        user_input,
     )
 
     assert configure_result["type"] is FlowResultType.ABORT
-    assert configure_result["reason"] == "reauth_successful"
+    assert configure_result["reason"] == expected_reason
 
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
 async def test_reauth_flow_wrong_device(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
     hass: HomeAssistant,
-    mock_bleak_client,
+    patched_flow_deps: SimpleNamespace,
 ) -> None:
     """Test reauth flow with wrong device (random MAC, dev_id mismatch)."""
     # Create a mock device with random MAC so dev_id is used as unique_id
-    mock_device = AsyncMock()
-    mock_device.address = MOCKED_CONF_MAC
-    mock_device.name = MOCKED_CONF_NAME
-    mock_device.details = MagicMock()
-    mock_device.details.address_type = "random"
-
-    mock_device_from_address.return_value = mock_device
-    mock_establish_connection.return_value = mock_bleak_client
-    # Return a different dev_id than the one stored in the entry
-    mock_validate_pin.return_value = PinValidationResult(True, "different_dev_id", 2)
-
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        unique_id=MOCKED_CONF_DEV_ID,
-        data=MOCKED_CONFIG,
-    )
-    entry.add_to_hass(hass)
-
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_REAUTH, "entry_id": entry.entry_id},
+    mock_device = SimpleNamespace(
+        address=MOCKED_CONF_MAC,
+        name=MOCKED_CONF_NAME,
+        details=SimpleNamespace(address_type="random"),
     )
 
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        MOCKED_CONFIG,
+    patched_flow_deps.device.return_value = mock_device
+    # Return a different dev_id than the one stored in the entry
+    patched_flow_deps.validate.return_value = PinValidationResult(
+        True, "different_dev_id", 2
     )
 
-    assert configure_result["type"] is FlowResultType.ABORT
-    assert configure_result["reason"] == "wrong_device"
-
-
-# -------------------------------
-# Reconfigure Flow Tests
-# -------------------------------
-
-
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
-async def test_reconfigure_flow_success(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
-    hass: HomeAssistant,
-    mock_bluetooth_device,
-    mock_bleak_client,
-) -> None:
-    """Test successful reconfigure flow."""
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.return_value = PinValidationResult(True, MOCKED_CONF_DEV_ID, 2)
-
     entry = MockConfigEntry(
         domain=DOMAIN,
-        unique_id=MOCKED_CONF_MAC,
+        unique_id=MOCKED_CONF_DEV_ID,
         data=MOCKED_CONFIG,
     )
     entry.add_to_hass(hass)
 
-    flow_result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_RECONFIGURE, "entry_id": entry.entry_id},
-    )
-
-    assert flow_result["type"] is FlowResultType.FORM
-
-    configure_result = await hass.config_entries.flow.async_configure(
-        flow_result["flow_id"],
-        {**MOCKED_CONFIG, CONF_NAME: "New Name"},
+    configure_result = await _submit_flow(
+        hass, {"source": SOURCE_REAUTH, "entry_id": entry.entry_id}, MOCKED_CONFIG
     )
 
     assert configure_result["type"] is FlowResultType.ABORT
-    assert configure_result["reason"] == "reconfigure_successful"
+    assert configure_result["reason"] == "wrong_device"
 
 
 # -------------------------------
@@ -434,101 +343,48 @@ async def test_reconfigure_flow_success(
 # -------------------------------
 
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
 async def test_validate_input_success(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
-    hass: HomeAssistant,
-    mock_bluetooth_device,
-    mock_bleak_client,
+    validate_flow: BlancoUnitConfigFlow,
 ) -> None:
     """Test successful input validation."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
-
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.return_value = PinValidationResult(True, "test_device_id", 2)
-
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-
-    result = await flow.validate_input(MOCKED_CONFIG)
+    result = await validate_flow.validate_input(MOCKED_CONFIG)
 
     assert not result.errors
     assert result.description_placeholders is None
 
 
-async def test_validate_input_value_error(hass: HomeAssistant) -> None:
+async def test_validate_input_value_error(validate_flow: BlancoUnitConfigFlow) -> None:
     """Test input validation with value error."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
-
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-
-    result = await flow.validate_input({**MOCKED_CONFIG, CONF_PIN: "abc"})
+    result = await validate_flow.validate_input(NON_NUMERIC_PIN_CONFIG)
 
     assert result.errors[CONF_ERROR] == "invalid_pin_format"
 
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
 async def test_validate_input_disconnects_on_success(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
-    hass: HomeAssistant,
-    mock_bluetooth_device,
+    validate_flow: BlancoUnitConfigFlow,
     mock_bleak_client,
 ) -> None:
     """Test that validate_input disconnects client after success."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
+    disconnects_before = mock_bleak_client.disconnect.await_count
 
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.return_value = (True, None)
+    result = await validate_flow.validate_input(MOCKED_CONFIG)
 
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-
-    await flow.validate_input(MOCKED_CONFIG)
-
-    mock_bleak_client.disconnect.assert_awaited_once()
+    assert not result.errors
+    assert mock_bleak_client.disconnect.await_count == disconnects_before + 1
 
 
-@patch("custom_components.blanco_unit.config_flow.validate_pin")
-@patch("custom_components.blanco_unit.config_flow.establish_connection")
-@patch(
-    "custom_components.blanco_unit.config_flow.bluetooth.async_ble_device_from_address"
-)
 async def test_validate_input_disconnects_on_error(
-    mock_device_from_address: AsyncMock,
-    mock_establish_connection: AsyncMock,
-    mock_validate_pin: AsyncMock,
-    hass: HomeAssistant,
-    mock_bluetooth_device,
+    validate_flow: BlancoUnitConfigFlow,
+    patched_flow_deps: SimpleNamespace,
     mock_bleak_client,
 ) -> None:
     """Test that validate_input disconnects client after error."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
+    disconnects_before = mock_bleak_client.disconnect.await_count
+    patched_flow_deps.validate.side_effect = Exception("Test error")
 
-    mock_device_from_address.return_value = mock_bluetooth_device
-    mock_establish_connection.return_value = mock_bleak_client
-    mock_validate_pin.side_effect = Exception("Test error")
+    await validate_flow.validate_input(MOCKED_CONFIG)
 
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-
-    await flow.validate_input(MOCKED_CONFIG)
-
-    mock_bleak_client.disconnect.assert_awaited_once()
+    assert mock_bleak_client.disconnect.await_count == disconnects_before + 1
 
 
 # -------------------------------
@@ -536,86 +392,39 @@ async def test_validate_input_disconnects_on_error(
 # -------------------------------
 
 
-async def test_prefilled_form_with_data(hass: HomeAssistant) -> None:
-    """Test prefilled form with existing data."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
-
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-
-    schema = flow.prefilledForm(data=MOCKED_CONFIG)
-
-    # Validate schema creates proper defaults
-    validated = schema({CONF_PIN: MOCKED_CONF_PIN})
-    assert validated[CONF_MAC] == MOCKED_CONF_MAC
-    assert validated[CONF_NAME] == MOCKED_CONF_NAME
-    assert validated[CONF_PIN] == MOCKED_CONF_PIN
-
-
-async def test_prefilled_form_with_discovery_info(
-    hass: HomeAssistant,
-    mock_discovery,
-) -> None:
-    """Test prefilled form with discovery info."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
-
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-    flow._discovery_info = mock_discovery
-
-    schema = flow.prefilledForm()
-
-    # Validate schema uses discovery info
-    validated = schema({CONF_PIN: MOCKED_CONF_PIN})
-    assert validated[CONF_MAC] == MOCKED_CONF_MAC
-    assert validated[CONF_NAME] == MOCKED_CONF_NAME
-
-
-async def test_prefilled_form_without_data(hass: HomeAssistant) -> None:
-    """Test prefilled form without data."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
-
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-
-    schema = flow.prefilledForm()
-
-    # Schema should accept full input
-    validated = schema(MOCKED_CONFIG)
-    assert validated[CONF_MAC] == MOCKED_CONF_MAC
-    assert validated[CONF_NAME] == MOCKED_CONF_NAME
-    assert validated[CONF_PIN] == MOCKED_CONF_PIN
-
-
-async def test_prefilled_form_mac_not_editable(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("kwargs", "discovered", "user_input", "read_only_field"),
+    [
+        pytest.param(
+            {"data": MOCKED_CONFIG}, False, PIN_ONLY_INPUT, None, id="with_data"
+        ),
+        pytest.param({}, True, PIN_ONLY_INPUT, CONF_MAC, id="with_discovery_info"),
+        pytest.param({}, False, MOCKED_CONFIG, None, id="without_data"),
+        pytest.param(
+            {"data": MOCKED_CONFIG, "name_editable": False},
+            False,
+            PIN_ONLY_INPUT,
+            CONF_NAME,
+            id="name_not_editable",
+        ),
+    ],
+)
+async def test_prefilled_form(
+    form_flow: BlancoUnitConfigFlow,
     mock_discovery,
+    kwargs: dict[str, Any],
+    discovered: bool,
+    user_input: dict[str, Any],
+    read_only_field: str | None,
 ) -> None:
-    """Test prefilled form with MAC not editable when discovery info present."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
-
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
-    flow._discovery_info = mock_discovery
-
-    schema = flow.prefilledForm()
-
-    # Check that MAC field is read-only
-    mac_field = schema.schema[CONF_MAC]
-    assert hasattr(mac_field, "config")
-    assert mac_field.config["read_only"] is True
-
-
-async def test_prefilled_form_name_not_editable(hass: HomeAssistant) -> None:
-    """Test prefilled form with name not editable."""
-    from custom_components.blanco_unit.config_flow import BlancoUnitConfigFlow
+    """Test prefilled form defaults and read-only fields."""
+    form_flow._discovery_info = mock_discovery if discovered else None
 
-    flow = BlancoUnitConfigFlow()
-    flow.hass = hass
+    schema = form_flow.prefilledForm(**kwargs)
 
-    schema = flow.prefilledForm(data=MOCKED_CONFIG, name_editable=False)
+    # Missing fields are filled from the data or discovery info
+    assert schema(user_input) == MOCKED_CONFIG
 
-    # Check that name field is read-only
-    name_field = schema.schema[CONF_NAME]
-    assert hasattr(name_field, "config")
-    assert name_field.config["read_only"] is True
+    # Only the expected field is read-only
+    for field in (CONF_MAC, CONF_NAME):
+        assert schema.schema[field].config["read_only"] is (field == read_only_field)
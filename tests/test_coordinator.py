@@ -1,14 +1,30 @@
 """Tests for the Blanco Unit coordinator."""
 
+import asyncio
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from bleak_retry_connector import BleakConnectionError, BleakNotFoundError
 import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.blanco_unit.client import BlancoUnitAuthenticationError
-from custom_components.blanco_unit.const import CONF_MAC, CONF_PIN
-from custom_components.blanco_unit.coordinator import BlancoUnitCoordinator
+from custom_components.blanco_unit import coordinator as coordinator_module
+from custom_components.blanco_unit.client import (
+    BlancoUnitAuthenticationError,
+    BlancoUnitBluetoothClient,
+)
+from custom_components.blanco_unit.const import CONF_MAC, CONF_PIN, DOMAIN
+from custom_components.blanco_unit.coordinator import (
+    AVAILABLE_REFRESH_COOLDOWN,
+    BlancoUnitCoordinator,
+)
 from custom_components.blanco_unit.data import (
     BlancoUnitData,
     BlancoUnitIdentity,
@@ -18,11 +34,65 @@ from custom_components.blanco_unit.data import (
     BlancoUnitWifiInfo,
     BlancoUnitWifiNetwork,
 )
-from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+_SYSTEM_INFO = BlancoUnitSystemInfo(
+    sw_ver_comm_con="1.0.0",
+    sw_ver_elec_con="1.0.0",
+    sw_ver_main_con="1.0.0",
+    dev_name="Test Device",
+    reset_cnt=0,
+)
+
+_SETTINGS = BlancoUnitSettings(
+    calib_still_wtr=5,
+    calib_soda_wtr=5,
+    filter_life_tm=365,
+    post_flush_quantity=100,
+    set_point_cooling=7,
+    wtr_hardness=5,
+)
+
+_STATUS = BlancoUnitStatus(
+    tap_state=0,
+    filter_rest=100,
+    co2_rest=100,
+    wtr_disp_active=False,
+    firm_upd_avlb=False,
+    set_point_cooling=7,
+    clean_mode_state=0,
+    err_bits=0,
+)
+
+_IDENTITY = BlancoUnitIdentity(
+    serial_no="123456",
+    service_code="ABCDEF",
+)
+
+_WIFI_INFO = BlancoUnitWifiInfo(
+    cloud_connect=True,
+    ssid="TestSSID",
+    signal=-50,
+    ip="192.168.1.100",
+    ble_mac="AA:BB:CC:DD:EE:FF",
+    wifi_mac="11:22:33:44:55:66",
+    gateway="192.168.1.1",
+    gateway_mac="AA:BB:CC:DD:EE:00",
+    subnet="255.255.255.0",
+)
+
+_CONNECTED_DATA = BlancoUnitData(
+    connected=True,
+    available=True,
+    device_id="test_device_id",
+)
+
+
+def _noop() -> None:
+    """Stand in for the options update unsubscribe, which no test inspects."""
 
 
 @pytest.fixture
@@ -36,1144 +106,583 @@ def mock_device():
 @pytest.fixture
 def mock_config_entry():
     """Create a mock config entry."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
-    entry.title = "Test Blanco Unit"
-    entry.data = {CONF_MAC: "AA:BB:CC:DD:EE:FF", CONF_PIN: 12345}
-    return entry
+    return MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="test_entry_id",
+        title="Test Blanco Unit",
+        data={CONF_MAC: "AA:BB:CC:DD:EE:FF", CONF_PIN: 12345},
+    )
 
 
 @pytest.fixture
 def mock_client():
     """Create a mock Blanco Unit client."""
-    client = MagicMock()
+    client = AsyncMock(spec=BlancoUnitBluetoothClient)
     client.device_id = "test_device_id"
     client.is_connected = True
-    client.get_system_info = AsyncMock(
-        return_value=BlancoUnitSystemInfo(
-            sw_ver_comm_con="1.0.0",
-            sw_ver_elec_con="1.0.0",
-            sw_ver_main_con="1.0.0",
-            dev_name="Test Device",
-            reset_cnt=0,
-        )
-    )
-    client.get_settings = AsyncMock(
-        return_value=BlancoUnitSettings(
-            calib_still_wtr=5,
-            calib_soda_wtr=5,
-            filter_life_tm=365,
-            post_flush_quantity=100,
-            set_point_cooling=7,
-            wtr_hardness=5,
-        )
+    client.get_system_info.return_value = _SYSTEM_INFO
+    client.get_settings.return_value = _SETTINGS
+    client.get_status.return_value = _STATUS
+    client.get_device_identity.return_value = _IDENTITY
+    client.get_wifi_info.return_value = _WIFI_INFO
+    client.scan_wifi_networks.return_value = [
+        BlancoUnitWifiNetwork(ssid="TestWiFi", signal=66, auth_mode=3),
+        BlancoUnitWifiNetwork(ssid="OtherWiFi", signal=40, auth_mode=3),
+    ]
+    return client
+
+
+@pytest.fixture(autouse=True)
+def patched_coordinator_env(
+    monkeypatch: pytest.MonkeyPatch, mock_client
+) -> SimpleNamespace:
+    """Patch the coordinator's BLE client and bluetooth helpers."""
+    env = SimpleNamespace(
+        client_class=MagicMock(return_value=mock_client),
+        track_unavailable=MagicMock(),
+        register_callback=MagicMock(),
+        rediscover_address=MagicMock(),
     )
-    client.get_status = AsyncMock(
-        return_value=BlancoUnitStatus(
-            tap_state=0,
-            filter_rest=100,
-            co2_rest=100,
-            wtr_disp_active=False,
-            firm_upd_avlb=False,
-            set_point_cooling=7,
-            clean_mode_state=0,
-            err_bits=0,
-        )
+    monkeypatch.setattr(
+        coordinator_module, "BlancoUnitBluetoothClient", env.client_class
     )
-    client.get_device_identity = AsyncMock(
-        return_value=BlancoUnitIdentity(
-            serial_no="123456",
-            service_code="ABCDEF",
-        )
+    monkeypatch.setattr(
+        coordinator_module.bluetooth, "async_track_unavailable", env.track_unavailable
     )
-    client.get_wifi_info = AsyncMock(
-        return_value=BlancoUnitWifiInfo(
-            cloud_connect=True,
-            ssid="TestSSID",
-            signal=-50,
-            ip="192.168.1.100",
-            ble_mac="AA:BB:CC:DD:EE:FF",
-            wifi_mac="11:22:33:44:55:66",
-            gateway="192.168.1.1",
-            gateway_mac="AA:BB:CC:DD:EE:00",
-            subnet="255.255.255.0",
-        )
+    monkeypatch.setattr(
+        coordinator_module.bluetooth, "async_register_callback", env.register_callback
     )
-    client.disconnect = AsyncMock()
-    client.set_temperature = AsyncMock()
-    client.set_water_hardness = AsyncMock()
-    client.dispense_water = AsyncMock()
-    client.change_pin = AsyncMock()
-    client.set_calibration_still = AsyncMock()
-    client.set_calibration_soda = AsyncMock()
-    client.scan_wifi_networks = AsyncMock(
-        return_value=[
-            BlancoUnitWifiNetwork(ssid="TestWiFi", signal=66, auth_mode=3),
-            BlancoUnitWifiNetwork(ssid="OtherWiFi", signal=40, auth_mode=3),
-        ]
+    monkeypatch.setattr(
+        coordinator_module.bluetooth, "async_rediscover_address", env.rediscover_address
     )
-    client.connect_wifi = AsyncMock()
-    client.disconnect_wifi = AsyncMock()
-    client.allow_cloud_services = AsyncMock()
-    client.factory_reset = AsyncMock()
-    return client
+    return env
 
 
-async def test_coordinator_init(
+@pytest.fixture
+def make_coordinator(
     hass: HomeAssistant, mock_device, mock_config_entry
+) -> Callable[..., BlancoUnitCoordinator]:
+    """Return a factory for coordinators built on the patched environment."""
+
+    def _make(**overrides: Any) -> BlancoUnitCoordinator:
+        coordinator = BlancoUnitCoordinator(hass, mock_config_entry, mock_device, _noop)
+        for name, value in overrides.items():
+            setattr(coordinator, name, value)
+        return coordinator
+
+    return _make
+
+
+async def test_coordinator_init(
+    patched_coordinator_env,
+    make_coordinator,
 ) -> None:
     """Test coordinator initialization."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient"
-        ) as mock_client_class,
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ) as mock_track_unavailable,
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ) as mock_register_callback,
-    ):
-        mock_client_class.return_value = MagicMock()
-
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator()
 
-        assert coordinator.address == "AA:BB:CC:DD:EE:FF"
-        assert coordinator.mac_address == "AA:BB:CC:DD:EE:FF"
-        assert coordinator.update_interval == timedelta(minutes=1)
+    assert coordinator.address == "AA:BB:CC:DD:EE:FF"
+    assert coordinator.mac_address == "AA:BB:CC:DD:EE:FF"
+    assert coordinator.update_interval == timedelta(minutes=1)
 
-        mock_track_unavailable.assert_called_once()
-        mock_register_callback.assert_called_once()
+    patched_coordinator_env.track_unavailable.assert_called_once()
+    patched_coordinator_env.register_callback.assert_called_once()
 
 
 async def test_coordinator_available_callback(
-    hass: HomeAssistant, mock_device, mock_config_entry
+    hass: HomeAssistant,
+    make_coordinator,
 ) -> None:
-    """Test available callback triggers refresh."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient"
-        ) as mock_client_class,
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        mock_client_class.return_value = MagicMock()
-
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    """Test a burst of adverts triggers one immediate and one trailing refresh."""
+    info = SimpleNamespace(address="AA:BB:CC:DD:EE:FF")
 
-        info = MagicMock(spec=BluetoothServiceInfoBleak)
-        info.address = "AA:BB:CC:DD:EE:FF"
+    # The debouncer binds async_request_refresh when the coordinator is built
+    with patch.object(BlancoUnitCoordinator, "async_request_refresh") as mock_refresh:
+        coordinator = make_coordinator()
 
-        with patch.object(coordinator, "async_request_refresh") as mock_refresh:
+        for _ in range(10):
             coordinator._available_callback(info, None)
-            await hass.async_block_till_done()
+        # Only the first refresh is scheduled, one loop pass runs it
+        await asyncio.sleep(0)
 
-            mock_refresh.assert_called_once()
+        mock_refresh.assert_awaited_once()
+
+        # The other adverts fold into a single refresh once the cooldown ends
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + AVAILABLE_REFRESH_COOLDOWN + timedelta(seconds=1)
+        )
+        await hass.async_block_till_done()
+
+        assert mock_refresh.await_count == 2
+
+    await coordinator.unload()
 
 
 async def test_coordinator_unavailable_callback(
-    hass: HomeAssistant, mock_device, mock_config_entry
+    hass: HomeAssistant,
+    patched_coordinator_env,
+    make_coordinator,
 ) -> None:
     """Test unavailable callback sets device unavailable."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient"
-        ) as mock_client_class,
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        mock_client = MagicMock()
-        mock_client.is_connected = True
-        mock_client_class.return_value = mock_client
+    # Set initial data
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    info = SimpleNamespace(address="AA:BB:CC:DD:EE:FF")
 
-        # Set initial data
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
-
-        info = MagicMock(spec=BluetoothServiceInfoBleak)
-        info.address = "AA:BB:CC:DD:EE:FF"
+    coordinator._unavailable_callback(info)
 
-        with patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ) as mock_rediscover:
-            coordinator._unavailable_callback(info)
-
-            mock_rediscover.assert_called_once_with(hass, "AA:BB:CC:DD:EE:FF")
-            assert coordinator.data.available is False
+    patched_coordinator_env.rediscover_address.assert_called_once_with(
+        hass, "AA:BB:CC:DD:EE:FF"
+    )
+    assert coordinator.data.available is False
 
 
 async def test_coordinator_unload(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    patched_coordinator_env,
+    make_coordinator,
 ) -> None:
     """Test coordinator unload."""
-    unsub_listener = MagicMock()
     unsub_unavailable = MagicMock()
     unsub_available = MagicMock()
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable",
-            return_value=unsub_unavailable,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback",
-            return_value=unsub_available,
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    patched_coordinator_env.track_unavailable.return_value = unsub_unavailable
+    patched_coordinator_env.register_callback.return_value = unsub_available
 
-        await coordinator.unload()
+    coordinator = make_coordinator()
 
-        unsub_unavailable.assert_called_once()
-        unsub_available.assert_called_once()
-        mock_client.disconnect.assert_called_once()
+    await coordinator.unload()
+
+    unsub_unavailable.assert_called_once()
+    unsub_available.assert_called_once()
+    mock_client.disconnect.assert_called_once()
 
 
 async def test_coordinator_refresh_data(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test refresh_data method."""
-    unsub_listener = MagicMock()
+    coordinator = make_coordinator()
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        with patch.object(coordinator, "async_request_refresh") as mock_refresh:
-            await coordinator.refresh_data()
-            await hass.async_block_till_done()
+    with patch.object(coordinator, "async_request_refresh") as mock_refresh:
+        await coordinator.refresh_data()
+        # Only the refresh task is scheduled, one loop pass runs it
+        await asyncio.sleep(0)
 
-            mock_refresh.assert_called_once()
+        mock_refresh.assert_awaited_once()
 
 
 async def test_coordinator_disconnect(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test disconnect method."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator()
 
-        await coordinator.disconnect()
+    await coordinator.disconnect()
 
-        mock_client.disconnect.assert_called_once()
+    mock_client.disconnect.assert_called_once()
 
 
 async def test_coordinator_set_temperature(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test set_temperature method."""
-    unsub_listener = MagicMock()
-
     # Update mock to return the temperature we're setting
-    mock_client.get_settings = AsyncMock(
-        return_value=BlancoUnitSettings(
-            calib_still_wtr=5,
-            calib_soda_wtr=5,
-            filter_life_tm=365,
-            post_flush_quantity=100,
-            set_point_cooling=8,  # Match the temperature we're setting
-            wtr_hardness=5,
-        )
-    )
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    mock_client.get_settings.return_value = replace(_SETTINGS, set_point_cooling=8)
 
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        await coordinator.set_temperature(8)
+    await coordinator.set_temperature(8)
 
-        mock_client.set_temperature.assert_called_once_with(8)
-        mock_client.get_settings.assert_called_once()
+    mock_client.set_temperature.assert_called_once_with(8)
+    mock_client.get_settings.assert_called_once()
 
 
 async def test_coordinator_set_temperature_verification_failed(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test set_temperature when verification fails."""
-    unsub_listener = MagicMock()
-
     # Make get_settings return different value than set
-    mock_client.get_settings = AsyncMock(
-        return_value=BlancoUnitSettings(
-            calib_still_wtr=5,
-            calib_soda_wtr=5,
-            filter_life_tm=365,
-            post_flush_quantity=100,
-            set_point_cooling=7,  # Different from the 8 we're trying to set
-            wtr_hardness=5,
-        )
-    )
+    mock_client.get_settings.return_value = replace(_SETTINGS, set_point_cooling=7)
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await coordinator.set_temperature(8)
 
-        with pytest.raises(ServiceValidationError, match="not_saved_temperature"):
-            await coordinator.set_temperature(8)
+    assert exc_info.value.translation_key == "not_saved_temperature"
 
 
 async def test_coordinator_set_water_hardness(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test set_water_hardness method."""
-    unsub_listener = MagicMock()
-
     # Update mock to return the hardness we're setting
-    mock_client.get_settings = AsyncMock(
-        return_value=BlancoUnitSettings(
-            calib_still_wtr=5,
-            calib_soda_wtr=5,
-            filter_life_tm=365,
-            post_flush_quantity=100,
-            set_point_cooling=7,
-            wtr_hardness=7,  # Match the hardness we're setting
-        )
-    )
+    mock_client.get_settings.return_value = replace(_SETTINGS, wtr_hardness=7)
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    await coordinator.set_water_hardness(7)
 
-        await coordinator.set_water_hardness(7)
-
-        mock_client.set_water_hardness.assert_called_once_with(7)
-        mock_client.get_settings.assert_called_once()
+    mock_client.set_water_hardness.assert_called_once_with(7)
+    mock_client.get_settings.assert_called_once()
 
 
 async def test_coordinator_set_water_hardness_verification_failed(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test set_water_hardness when verification fails."""
-    unsub_listener = MagicMock()
-
     # Make get_settings return different value than set
-    mock_client.get_settings = AsyncMock(
-        return_value=BlancoUnitSettings(
-            calib_still_wtr=5,
-            calib_soda_wtr=5,
-            filter_life_tm=365,
-            post_flush_quantity=100,
-            set_point_cooling=7,
-            wtr_hardness=5,  # Different from the 7 we're trying to set
-        )
-    )
+    mock_client.get_settings.return_value = replace(_SETTINGS, wtr_hardness=5)
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await coordinator.set_water_hardness(7)
 
-        with pytest.raises(ServiceValidationError, match="not_saved_water_hardness"):
-            await coordinator.set_water_hardness(7)
+    assert exc_info.value.translation_key == "not_saved_water_hardness"
 
 
 async def test_coordinator_dispense_water(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test dispense_water method."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator()
 
-        with patch.object(coordinator, "async_request_refresh") as mock_refresh:
-            await coordinator.dispense_water(500, 2)
-            await hass.async_block_till_done()
+    with patch.object(coordinator, "async_request_refresh") as mock_refresh:
+        await coordinator.dispense_water(500, 2)
+        # Only the refresh task is scheduled, one loop pass runs it
+        await asyncio.sleep(0)
 
-            mock_client.dispense_water.assert_called_once_with(500, 2)
-            mock_refresh.assert_called_once()
+        mock_client.dispense_water.assert_called_once_with(500, 2)
+        mock_refresh.assert_awaited_once()
 
 
 async def test_coordinator_change_pin(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test change_pin method."""
-    unsub_listener = MagicMock()
+    coordinator = make_coordinator()
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        await coordinator.change_pin("54321")
+    await coordinator.change_pin("54321")
 
-        mock_client.change_pin.assert_called_once_with("54321")
-        mock_client.disconnect.assert_called_once()
+    mock_client.change_pin.assert_called_once_with("54321")
+    mock_client.disconnect.assert_called_once()
 
 
 async def test_coordinator_set_calibration_still(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test set_calibration_still method."""
-    unsub_listener = MagicMock()
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    await coordinator.set_calibration_still(7)
 
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
-
-        await coordinator.set_calibration_still(7)
-
-        mock_client.set_calibration_still.assert_called_once_with(7)
-        mock_client.get_settings.assert_called_once()
+    mock_client.set_calibration_still.assert_called_once_with(7)
+    mock_client.get_settings.assert_called_once()
 
 
 async def test_coordinator_set_calibration_soda(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test set_calibration_soda method."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        await coordinator.set_calibration_soda(8)
+    await coordinator.set_calibration_soda(8)
 
-        mock_client.set_calibration_soda.assert_called_once_with(8)
-        mock_client.get_settings.assert_called_once()
+    mock_client.set_calibration_soda.assert_called_once_with(8)
+    mock_client.get_settings.assert_called_once()
 
 
 async def test_coordinator_connection_changed(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test _connection_changed callback."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
-
-        coordinator._connection_changed(False)
+    coordinator._connection_changed(False)
 
-        assert coordinator.data.connected is False
+    assert coordinator.data.connected is False
 
 
 async def test_coordinator_async_update_data_success(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test successful data update."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator()
 
-        data = await coordinator._async_update_data()
+    data = await coordinator._async_update_data()
 
-        assert data.connected is True
-        assert data.available is True
-        assert data.device_id == "test_device_id"
-        assert data.system_info is not None
-        assert data.settings is not None
-        assert data.status is not None
-        assert data.identity is not None
-        assert data.wifi_info is not None
+    assert data.connected is True
+    assert data.available is True
+    assert data.device_id == "test_device_id"
+    assert data.system_info is not None
+    assert data.settings is not None
+    assert data.status is not None
+    assert data.identity is not None
+    assert data.wifi_info is not None
 
 
-async def test_coordinator_async_update_data_auth_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+async def test_coordinator_async_update_data_single_flight(
+    mock_client,
+    make_coordinator,
 ) -> None:
-    """Test data update with authentication error."""
-    unsub_listener = MagicMock()
+    """Test concurrent data updates share a single fetch."""
+    release = asyncio.Event()
+    system_info = mock_client.get_system_info.return_value
 
-    mock_client.get_system_info = AsyncMock(
-        side_effect=BlancoUnitAuthenticationError("Auth failed")
-    )
+    async def slow_get_system_info() -> BlancoUnitSystemInfo:
+        await release.wait()
+        return system_info
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    mock_client.get_system_info.side_effect = slow_get_system_info
 
-        with pytest.raises(ConfigEntryAuthFailed):
-            await coordinator._async_update_data()
+    coordinator = make_coordinator()
 
+    updates = [asyncio.create_task(coordinator._async_update_data()) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*updates)
 
-async def test_coordinator_async_update_data_connection_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
-) -> None:
-    """Test data update with connection error."""
-    unsub_listener = MagicMock()
+    assert mock_client.get_system_info.call_count == 1
+    assert mock_client.get_settings.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert coordinator._update_inflight is None
 
-    mock_client.get_system_info = AsyncMock(side_effect=BleakConnectionError("Error"))
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        pytest.param(
+            BlancoUnitAuthenticationError("Auth failed"),
+            ConfigEntryAuthFailed,
+            id="auth_error",
         ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        # Set initial data so _set_unavailable can work properly
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
-
-        with pytest.raises(UpdateFailed):
-            await coordinator._async_update_data()
-
-
-async def test_coordinator_async_update_data_not_found_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+        pytest.param(ValueError("Error"), UpdateFailed, id="generic_error"),
+    ],
+)
+async def test_coordinator_async_update_data_single_flight_errors(
+    mock_client,
+    make_coordinator,
+    error: Exception,
+    expected: type[Exception],
 ) -> None:
-    """Test data update with device not found error."""
-    unsub_listener = MagicMock()
+    """Test a failing shared fetch raises the mapped error to every caller."""
+    release = asyncio.Event()
 
-    mock_client.get_system_info = AsyncMock(side_effect=BleakNotFoundError("Error"))
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        # Set initial data so _set_unavailable can work properly
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
-
-        with pytest.raises(UpdateFailed):
-            await coordinator._async_update_data()
+    async def slow_get_system_info() -> BlancoUnitSystemInfo:
+        await release.wait()
+        raise error
 
+    mock_client.get_system_info.side_effect = slow_get_system_info
 
-async def test_coordinator_async_update_data_generic_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
-) -> None:
-    """Test data update with generic error."""
-    unsub_listener = MagicMock()
-
-    mock_client.get_system_info = AsyncMock(side_effect=ValueError("Error"))
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    updates = [asyncio.create_task(coordinator._async_update_data()) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*updates, return_exceptions=True)
 
-        # Set initial data so _set_unavailable can work properly
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    assert mock_client.get_system_info.call_count == 1
+    assert all(isinstance(result, expected) for result in results)
+    assert coordinator._update_inflight is None
 
-        with pytest.raises(UpdateFailed):
-            await coordinator._async_update_data()
 
-
-async def test_coordinator_call_auth_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+async def test_coordinator_async_update_data_single_flight_cancelled(
+    mock_client,
+    make_coordinator,
 ) -> None:
-    """Test _call method with authentication error."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        async def failing_func():
-            raise BlancoUnitAuthenticationError("Auth failed")
-
-        with pytest.raises(ConfigEntryAuthFailed):
-            await coordinator._call(failing_func)
-
-
-async def test_coordinator_call_connection_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    """Test callers fetch again when the fetch they joined is cancelled."""
+    release = asyncio.Event()
+    system_info = mock_client.get_system_info.return_value
+
+    async def slow_get_system_info() -> BlancoUnitSystemInfo:
+        await release.wait()
+        return system_info
+
+    mock_client.get_system_info.side_effect = slow_get_system_info
+
+    coordinator = make_coordinator()
+
+    first = asyncio.create_task(coordinator._async_update_data())
+    await asyncio.sleep(0)
+    joined = [asyncio.create_task(coordinator._async_update_data()) for _ in range(4)]
+    await asyncio.sleep(0)
+    first.cancel()
+    # A few loop passes let the joined callers see the cancellation and refetch
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*joined)
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert mock_client.get_system_info.call_count == 2
+    assert all(result is results[0] for result in results)
+    assert coordinator._update_inflight is None
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        pytest.param(
+            BlancoUnitAuthenticationError("Auth failed"),
+            ConfigEntryAuthFailed,
+            id="auth_error",
+        ),
+        pytest.param(
+            BleakConnectionError("Error"), UpdateFailed, id="connection_error"
+        ),
+        pytest.param(BleakNotFoundError("Error"), UpdateFailed, id="not_found_error"),
+        pytest.param(ValueError("Error"), UpdateFailed, id="generic_error"),
+    ],
+)
+async def test_coordinator_async_update_data_errors(
+    mock_client,
+    make_coordinator,
+    error: Exception,
+    expected: type[Exception],
 ) -> None:
-    """Test _call method with connection error."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    """Test data update maps client errors to coordinator errors."""
+    mock_client.get_system_info.side_effect = error
 
-        async def failing_func():
-            raise BleakConnectionError("Error")
+    # Set initial data so _set_unavailable can work properly
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        with pytest.raises(ServiceValidationError):
-            await coordinator._call(failing_func)
+    with pytest.raises(expected):
+        await coordinator._async_update_data()
 
 
-async def test_coordinator_call_not_found_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
-) -> None:
-    """Test _call method with not found error."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        pytest.param(
+            BlancoUnitAuthenticationError("Auth failed"),
+            ConfigEntryAuthFailed,
+            id="auth_error",
         ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
+        pytest.param(
+            BleakConnectionError("Error"),
+            ServiceValidationError,
+            id="connection_error",
         ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
+        pytest.param(
+            BleakNotFoundError("Error"),
+            ServiceValidationError,
+            id="not_found_error",
         ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
-
-        async def failing_func():
-            raise BleakNotFoundError("Error")
-
-        with pytest.raises(ServiceValidationError):
-            await coordinator._call(failing_func)
-
-
-async def test_coordinator_call_generic_error(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+        pytest.param(ValueError("Error"), ServiceValidationError, id="generic_error"),
+    ],
+)
+async def test_coordinator_call_errors(
+    mock_client,
+    make_coordinator,
+    error: Exception,
+    expected: type[Exception],
 ) -> None:
-    """Test _call method with generic error."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    """Test _call maps client errors to service errors."""
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        async def failing_func():
-            raise ValueError("Error")
+    async def failing_func():
+        raise error
 
-        with pytest.raises(ServiceValidationError):
-            await coordinator._call(failing_func)
+    with pytest.raises(expected):
+        await coordinator._call(failing_func)
 
 
 async def test_coordinator_set_unavailable_with_no_data(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    hass: HomeAssistant,
+    mock_client,
+    patched_coordinator_env,
+    make_coordinator,
 ) -> None:
     """Test _set_unavailable when no data exists yet."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_rediscover_address"
-        ) as mock_rediscover,
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator()
 
-        coordinator.data = None
+    coordinator.data = None
 
-        coordinator._set_unavailable()
+    coordinator._set_unavailable()
 
-        # Should still trigger rediscovery
-        mock_rediscover.assert_called_once_with(hass, "AA:BB:CC:DD:EE:FF")
+    # Should still trigger rediscovery
+    patched_coordinator_env.rediscover_address.assert_called_once_with(
+        hass, "AA:BB:CC:DD:EE:FF"
+    )
 
 
 async def test_coordinator_scan_wifi_networks(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test scan_wifi_networks method."""
-    unsub_listener = MagicMock()
+    coordinator = make_coordinator()
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        result = await coordinator.scan_wifi_networks()
+    result = await coordinator.scan_wifi_networks()
 
-        mock_client.scan_wifi_networks.assert_called_once()
-        assert isinstance(result, list)
-        assert len(result) == 2
+    mock_client.scan_wifi_networks.assert_called_once()
+    assert isinstance(result, list)
+    assert len(result) == 2
 
 
 async def test_coordinator_connect_wifi(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test connect_wifi method."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        await coordinator.connect_wifi("TestSSID", "password123")
+    await coordinator.connect_wifi("TestSSID", "password123")
 
 
 async def test_coordinator_disconnect_wifi(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test disconnect_wifi method."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        coordinator.data = BlancoUnitData(
-            connected=True,
-            available=True,
-            device_id="test_device_id",
-        )
+    coordinator = make_coordinator(data=_CONNECTED_DATA)
 
-        await coordinator.disconnect_wifi()
+    await coordinator.disconnect_wifi()
 
 
 async def test_coordinator_allow_cloud_services(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test allow_cloud_services method."""
-    unsub_listener = MagicMock()
+    coordinator = make_coordinator()
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    await coordinator.allow_cloud_services("test_id")
 
-        await coordinator.allow_cloud_services("test_id")
-
-        mock_client.allow_cloud_services.assert_called_once_with("test_id")
+    mock_client.allow_cloud_services.assert_called_once_with("test_id")
 
 
 async def test_coordinator_allow_cloud_services_default_rca(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test allow_cloud_services method with default rca_id."""
-    unsub_listener = MagicMock()
+    coordinator = make_coordinator()
 
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
-
-        await coordinator.allow_cloud_services()
+    await coordinator.allow_cloud_services()
 
-        mock_client.allow_cloud_services.assert_called_once_with("")
+    mock_client.allow_cloud_services.assert_called_once_with("")
 
 
 async def test_coordinator_factory_reset(
-    hass: HomeAssistant, mock_device, mock_config_entry, mock_client
+    mock_client,
+    make_coordinator,
 ) -> None:
     """Test factory_reset method."""
-    unsub_listener = MagicMock()
-
-    with (
-        patch(
-            "custom_components.blanco_unit.coordinator.BlancoUnitBluetoothClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_track_unavailable"
-        ),
-        patch(
-            "custom_components.blanco_unit.coordinator.bluetooth.async_register_callback"
-        ),
-    ):
-        coordinator = BlancoUnitCoordinator(
-            hass, mock_config_entry, mock_device, unsub_listener
-        )
+    coordinator = make_coordinator()
 
-        await coordinator.factory_reset()
+    await coordinator.factory_reset()
@@ -1,5 +1,6 @@
 """Tests for the Blanco Unit __init__ module."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,10 +24,7 @@ from custom_components.blanco_unit.const import (
     DOMAIN,
     RANDOM_MAC_PLACEHOLDER,
 )
-from homeassistant.components.bluetooth import (
-    BluetoothChange,
-    BluetoothServiceInfoBleak,
-)
+from homeassistant.components.bluetooth import BluetoothChange
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -196,8 +194,7 @@ async def test_async_setup_entry_ble_callback_triggers_reload(
             await async_setup_entry(hass, mock_entry)
 
         # Simulate device discovery
-        info = MagicMock(spec=BluetoothServiceInfoBleak)
-        info.address = "AA:BB:CC:DD:EE:FF"
+        info = SimpleNamespace(address="AA:BB:CC:DD:EE:FF")
         change = BluetoothChange.ADVERTISEMENT
 
         callback_func(info, change)